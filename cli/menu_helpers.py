@@ -13,10 +13,13 @@ These functions are shared across all menu modules to maintain consistent behavi
 """
 
 import datetime
+import functools
 from collections import Counter
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from enum import Enum
-from typing import Any
+from itertools import batched
+from operator import attrgetter
+from typing import Any, Literal
 
 import cli.model_formatters as model_formatters
 import core.formatters as formatters
@@ -28,6 +31,16 @@ from models.student import AttendanceStatus, Student
 from models.submission import Submission
 from models.types import RecordType
 
+# result lines are formatted lazily and printed this many at a time, so a long list
+# never holds more than one batch of strings and a short one is a single write
+_DISPLAY_BATCH_SIZE = 100
+
+# accepted answers for every y/n confirmation, resolved with one lookup
+_CONFIRM_CHOICES = {"y": True, "yes": True, "n": False, "no": False}
+
+# shown ahead of every destructive confirmation
+_CAUTION_BANNER = formatters.format_banner_text("CAUTION!")
+
 
 class MenuSignal(Enum):
     APPLY = "APPLY"
@@ -44,35 +57,38 @@ class MenuSignal(Enum):
 
 def display_menu(
     title: str,
-    options: list[tuple[str, Callable[..., Any]]],
+    options: Sequence[tuple[str, Any]],
     zero_option: str = "Return",
-) -> MenuSignal | Callable[..., Any]:
+) -> MenuSignal | Any:
     """
-    Displays a numbered CLI menu and returns the selected action.
+    Displays a numbered CLI menu and returns the selected action or value.
 
     Args:
         title (str): The heading displayed above the menu options.
-        options (list[tuple[str, Callable[..., Any]]]): A list of (label, action) pairs to present.
+        options (Sequence[tuple[str, Any]]): The (label, action) or (label, value) pairs to present. May be a module-level tuple built once at import.
         zero_option (str, optional): The label for the "cancel" or "exit" option. Defaults to "Return".
 
     Returns:
         `MenuSignal.EXIT` if the user selects the zero option.
-        Callable[..., Any]: The function associated with the selected menu item.
+        Any: The action or value paired with the selected menu item, returned as-is.
 
     Raises:
         ValueError, IndexError: Handled internally if user input is not a valid option.
 
     Notes:
         - Menu selection is repeated until a valid choice is made.
-        - User input is matched by menu index, not by label.
+        - User input is matched by menu index, not by label, so dispatch is a single O(1) lookup.
+        - The menu text is rendered once per call and printed in a single write; for the module-level tuple option tables it is cached across calls.
     """
-    while True:
-        print(f"\n{title}")
-
-        for i, (label, _) in enumerate(options, 1):
-            print(f"{i}. {label}")
+    # only the module-level option tables are tuples; per-call lists (including record
+    # pickers, whose models are unhashable) are rendered once for this prompt loop
+    if isinstance(options, tuple):
+        menu_text = _render_static_menu(title, options, zero_option)
+    else:
+        menu_text = _render_menu(title, options, zero_option)
 
-        print(f"0. {zero_option}")
+    while True:
+        print(menu_text)
 
         choice = prompt_user_input("\nSelect an option: ")
 
@@ -85,6 +101,74 @@ def display_menu(
             print("Invalid selection. Please try again.")
 
 
+def _render_menu(
+    title: str, options: Sequence[tuple[str, Any]], zero_option: str
+) -> str:
+    lines = [f"\n{title}"]
+    lines.extend(f"{i}. {label}" for i, (label, _) in enumerate(options, 1))
+    lines.append(f"0. {zero_option}")
+
+    return "\n".join(lines)
+
+
+# the static option tables are built once at import, so their rendered text is too
+_render_static_menu = functools.lru_cache(maxsize=64)(_render_menu)
+
+
+def dispatch_menu_selection(
+    title: str,
+    options: Sequence[tuple[str, Callable[..., Any]]],
+    zero_option: str,
+    *args: Any,
+) -> bool:
+    """
+    Displays a menu once and calls the selected handler with `*args`.
+
+    Args:
+        title (str): The heading displayed above the menu options.
+        options (Sequence[tuple[str, Callable[..., Any]]]): The (label, handler) pairs to present.
+        zero_option (str): The label for the "cancel" or "exit" option.
+        *args (Any): Positional arguments forwarded to the selected handler (e.g., the active `Gradebook`).
+
+    Returns:
+        False if the user selects the zero option, and True once the selected handler has run.
+
+    Raises:
+        RuntimeError: If the menu response is unrecognized.
+    """
+    menu_response = display_menu(title, options, zero_option)
+
+    if menu_response is MenuSignal.EXIT:
+        return False
+    elif callable(menu_response):
+        menu_response(*args)
+        return True
+    else:
+        raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+
+
+def run_menu_loop(
+    title: str,
+    options: Sequence[tuple[str, Callable[..., Any]]],
+    zero_option: str,
+    *args: Any,
+) -> None:
+    """
+    Repeats `dispatch_menu_selection()` until the user selects the zero option.
+
+    Args:
+        title (str): The heading displayed above the menu options.
+        options (Sequence[tuple[str, Callable[..., Any]]]): The (label, handler) pairs to present.
+        zero_option (str): The label for the "cancel" or "exit" option.
+        *args (Any): Positional arguments forwarded to each selected handler.
+
+    Raises:
+        RuntimeError: If the menu response is unrecognized.
+    """
+    while dispatch_menu_selection(title, options, zero_option, *args):
+        pass
+
+
 def display_results(
     results: Iterable[Any],
     show_index: bool = False,
@@ -97,10 +181,17 @@ def display_results(
         results (Iterable[Any]): A sequence of results to display.
         show_index (bool, optional): If True, prepends a numbered index to each result. Defaults to False.
         formatter (Callable[[Any], str], optional): A function to convert each result to a display string. Defaults to str().
+
+    Notes:
+        - Lines are formatted as they are consumed and printed in batches of `_DISPLAY_BATCH_SIZE`, one `print()` per batch.
     """
-    for i, result in enumerate(results, 1):
-        prefix = f"{i:>2}. " if show_index else ""
-        print(f"{prefix}{formatter(result)}")
+    if show_index:
+        lines = (f"{i:>2}. {formatter(result)}" for i, result in enumerate(results, 1))
+    else:
+        lines = (formatter(result) for result in results)
+
+    for batch in batched(lines, _DISPLAY_BATCH_SIZE):
+        print("\n".join(batch))
 
 
 def sort_and_display_records(
@@ -171,38 +262,25 @@ def sort_and_display_submissions(
 
 
 def sort_and_display_course_dates(
-    calendar_dates: set[datetime.date] | list[datetime.date],
+    calendar_dates: Iterable[datetime.date],
     calendar_name: str = "Calendar View",
 ) -> None:
     """
     Prints a sorted list of course dates, grouped by month and labeled with a banner.
 
     Args:
-        calendar_dates (set[datetime.date] | list[datetime.date]): The dates to display.
+        calendar_dates (Iterable[datetime.date]): The dates to display. Duplicates are ignored.
         calendar_name (str, optional): A custom title for the banner heading. Defaults to "Calendar View".
 
     Notes:
-        - If `calendar_dates` is an empty set/list, a "no dates" message is displayed.
-        - Dates are grouped by (month, year) and printed in ascending order.
-        - Formatting is handled via `formatters.format_banner_text()`, `format_month_and_year()`, and `format_class_date_short()`.
+        - If `calendar_dates` is empty, a "no dates" message is displayed.
+        - Dates are deduplicated with `dict.fromkeys()` and sorted once, so callers may pass any iterable.
+        - Dates are grouped by (month, year) and printed in ascending order as a single write.
+        - Rendering is handled by `formatters.format_course_calendar()`; callers that show the same dates more than once may render with it directly and reuse the text.
     """
-    banner = formatters.format_banner_text(calendar_name)
-    print(f"\n{banner}")
-
-    if not calendar_dates:
-        print("\nNo dates to display.\n")
-
-    last_month_printed = (None, None)
+    sorted_dates = sorted(dict.fromkeys(calendar_dates))
 
-    for current_date in sorted(calendar_dates):
-        current_month_and_year = (current_date.month, current_date.year)
-
-        if current_month_and_year != last_month_printed:
-            formatted_month = formatters.format_month_and_year(current_date)
-            print(f"\n{formatted_month}\n")
-            last_month_printed = current_month_and_year
-
-        print(f"   {formatters.format_class_date_short(current_date)}")
+    print(formatters.format_course_calendar(sorted_dates, calendar_name))
 
 
 def display_attendance_summary(class_date: datetime.date, gradebook: Gradebook) -> None:
@@ -291,15 +369,15 @@ def display_attendance_buckets(
 
 
 def confirm_action(prompt: str) -> bool:
+    prompt = f"{prompt} (y/n): "
+
     while True:
-        choice = prompt_user_input(f"{prompt} (y/n): ").lower()
+        choice = _CONFIRM_CHOICES.get(prompt_user_input(prompt).lower())
 
-        if choice == "y" or choice == "yes":
-            return True
-        elif choice == "n" or choice == "no":
-            return False
-        else:
-            print("Invalid selection. Please try again.")
+        if choice is not None:
+            return choice
+
+        print("Invalid selection. Please try again.")
 
 
 def confirm_make_change() -> bool:
@@ -321,7 +399,8 @@ def prompt_user_input(prompt: str) -> str:
     return input(f"\n{prompt}\n  >> ").strip()
 
 
-def prompt_user_input_or_cancel(prompt: str) -> str | MenuSignal:
+def prompt_user_input_or_cancel(prompt: str) -> str | Literal[MenuSignal.CANCEL]:
+    """Returns the stripped input, or `MenuSignal.CANCEL` (the only signal it produces) if blank."""
     user_input = prompt_user_input(prompt)
     return MenuSignal.CANCEL if user_input == "" else user_input
 
@@ -342,7 +421,7 @@ def prompt_user_input_or_none(prompt: str) -> str | None:
 
 
 def prompt_selection_from_list(
-    list_data: list[RecordType],
+    list_data: Sequence[RecordType],
     list_description: str,
     sort_key: Callable[[RecordType], Any] = lambda x: x,
     formatter: Callable[[RecordType], str] = lambda x: str(x),
@@ -351,7 +430,7 @@ def prompt_selection_from_list(
     Prompts the user to select an item from a list of records.
 
     Args:
-        list_data (list[RecordType]): The records to choose from.
+        list_data (Sequence[RecordType]): The records to choose from.
         list_description (str): A short description used in prompts and headings (e.g. "students").
         sort_key (Callable[[RecordType], Any], optional): Sort function for ordering the list. Defaults to identity.
         formatter (Callable[[RecordType], str], optional): Function to convert each record to a display string. Defaults to str().
@@ -456,18 +535,18 @@ def prompt_student_selection_from_search(
 ) -> Student | None:
     return prompt_selection_from_search(
         search_results,
-        lambda x: (x.last_name, x.first_name),
+        attrgetter("last_name", "first_name"),
         model_formatters.format_student_oneline,
     )
 
 
 def prompt_student_selection_from_list(
-    list_data: list[Student], list_description: str
+    list_data: Sequence[Student], list_description: str
 ) -> Student | None:
     return prompt_selection_from_list(
         list_data,
         list_description,
-        lambda x: (x.last_name, x.first_name),
+        attrgetter("last_name", "first_name"),
         model_formatters.format_student_oneline,
     )
 
@@ -501,21 +580,15 @@ def find_active_student_from_list(gradebook: Gradebook) -> Student | MenuSignal:
 
     Returns:
         - The selected `Student`, if available.
-        - `MenuSignal.CANCEL` if the list is empty, the user cancels, or the record lookup fails.
+        - `MenuSignal.CANCEL` if the list is empty or the user cancels.
 
     Notes:
-        - Records are sorted by last name, then first name.
+        - Reads the cached `Gradebook.active_students_sorted` partition, which is already sorted by last name, then first name.
     """
-    gradebook_response = gradebook.get_records(
-        gradebook.students, lambda x: x.is_active
+    student = prompt_student_selection_from_list(
+        gradebook.active_students_sorted, "Active Students"
     )
 
-    active_students = (
-        gradebook_response.data["records"] if gradebook_response.success else []
-    )
-
-    student = prompt_student_selection_from_list(active_students, "Active Students")
-
     return MenuSignal.CANCEL if student is None else student
 
 
@@ -528,21 +601,15 @@ def find_inactive_student_from_list(gradebook: Gradebook) -> Student | MenuSigna
 
     Returns:
         - The selected `Student`, if available.
-        - `MenuSignal.CANCEL` if the list is empty, the user cancels, or the record lookup fails.
+        - `MenuSignal.CANCEL` if the list is empty or the user cancels.
 
     Notes:
-        - Records are sorted by last name, then first name.
+        - Reads the cached `Gradebook.inactive_students_sorted` partition, which is already sorted by last name, then first name.
     """
-    gradebook_response = gradebook.get_records(
-        gradebook.students, lambda x: not x.is_active
+    student = prompt_student_selection_from_list(
+        gradebook.inactive_students_sorted, "Inactive Students"
     )
 
-    inactive_students = (
-        gradebook_response.data["records"] if gradebook_response.success else []
-    )
-
-    student = prompt_student_selection_from_list(inactive_students, "Inactive Students")
-
     return MenuSignal.CANCEL if student is None else student
 
 
@@ -568,17 +635,17 @@ def prompt_category_selection_from_search(
     search_results: list[Category],
 ) -> Category | None:
     return prompt_selection_from_search(
-        search_results, lambda x: x.name, model_formatters.format_category_oneline
+        search_results, attrgetter("name"), model_formatters.format_category_oneline
     )
 
 
 def prompt_category_selection_from_list(
-    list_data: list[Category], list_description: str
+    list_data: Sequence[Category], list_description: str
 ) -> Category | None:
     return prompt_selection_from_list(
         list_data,
         list_description,
-        lambda x: x.name,
+        attrgetter("name"),
         model_formatters.format_category_oneline,
     )
 
@@ -612,21 +679,13 @@ def find_active_category_from_list(gradebook: Gradebook) -> Category | MenuSigna
 
     Returns:
         - The selected `Category`, if available.
-        - `MenuSignal.CANCEL` if the list is empty, the user cancels, or the record lookup fails.
+        - `MenuSignal.CANCEL` if the list is empty or the user cancels.
 
     Notes:
-        - Records are sorted by name.
+        - Reads the cached `Gradebook.active_categories` partition, which is already sorted by name.
     """
-    gradebook_response = gradebook.get_records(
-        gradebook.categories, lambda x: x.is_active
-    )
-
-    active_categories = (
-        gradebook_response.data["records"] if gradebook_response.success else []
-    )
-
     category = prompt_category_selection_from_list(
-        active_categories, "Active Categories"
+        gradebook.active_categories, "Active Categories"
     )
 
     return MenuSignal.CANCEL if category is None else category
@@ -641,21 +700,13 @@ def find_inactive_category_from_list(gradebook: Gradebook) -> Category | MenuSig
 
     Returns:
         - The selected `Category`, if available.
-        - `MenuSignal.CANCEL` if the list is empty, the user cancels, or the record lookup fails.
+        - `MenuSignal.CANCEL` if the list is empty or the user cancels.
 
     Notes:
-        - Records are sorted by name.
+        - Reads the cached `Gradebook.inactive_categories` partition, which is already sorted by name.
     """
-    gradebook_response = gradebook.get_records(
-        gradebook.categories, lambda x: not x.is_active
-    )
-
-    inactive_categories = (
-        gradebook_response.data["records"] if gradebook_response.success else []
-    )
-
     category = prompt_category_selection_from_list(
-        inactive_categories, "Inactive Categories"
+        gradebook.inactive_categories, "Inactive Categories"
     )
 
     return MenuSignal.CANCEL if category is None else category
@@ -683,7 +734,7 @@ def prompt_assignment_selection_from_search(
     search_results: list[Assignment],
 ) -> Assignment | None:
     return prompt_selection_from_search(
-        search_results, lambda x: x.name, model_formatters.format_assignment_oneline
+        search_results, attrgetter("name"), model_formatters.format_assignment_oneline
     )
 
 
@@ -789,13 +840,15 @@ def returning_without_changes() -> None:
     print("\nReturning without changes.")
 
 
-def returning_to(destination: str) -> None:
-    print(f"\nReturning to {destination}.")
+def returning_to(destination: str, without_changes: bool = False) -> None:
+    if without_changes:
+        print(f"\nReturning without changes.\n\nReturning to {destination}.")
+    else:
+        print(f"\nReturning to {destination}.")
 
 
 def caution_banner() -> None:
-    caution_banner = formatters.format_banner_text("CAUTION!")
-    print(f"\n{caution_banner}")
+    print(f"\n{_CAUTION_BANNER}")
 
 
 def display_response_failure(response: Response, debug: bool = False) -> None:
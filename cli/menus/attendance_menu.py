@@ -20,6 +20,8 @@ Main entry points:
 
 Record Attendance actions (GatewayResponse):
 - START_UNMARKED: walk unmarked students, stage Present/Absent/Excused/Late (skip and cancel supported).
+- STAGE_ABSENT_BY_NUMBER: list unmarked students once, stage the absent roster numbers as Absent and everyone else as Present.
+- STAGE_FROM_STATUS_LINE: list unmarked students once, stage one P/A/E/L code per student from a single line of input.
 - STAGE_REMAINING_PRESENT / STAGE_REMAINING_ABSENT: bulk-stage remaining unmarked students.
 - EDIT_EXISTING: resolve any staging, then enter immediate-write edit flow for existing marks.
 - APPLY_NOW: compute diff-only payload and commit via batch API with retry/keep/discard for failures.
@@ -38,6 +40,8 @@ Input helpers:
 - prompt_class_date_or_cancel: strict YYYY-MM-DD input parsed via date.fromisoformat; blank cancels.
 - prompt_class_date_from_schedule: pick from scheduled dates with an optional “[ATTENDANCE TAKEN]” badge (all active students marked).
 - prompt_start_and_end_dates / prompt_weekdays_or_cancel / prompt_no_class_dates: data entry steps used by the recurring generator.
+- prompt_roster_numbers_or_cancel: parse a single line of roster numbers (commas and/or spaces) for bulk staging.
+- prompt_status_line_or_cancel: parse a single line of per-student status codes (e.g., "p p a l -" or "ppal-").
 
 Guarantees and policies:
 - Gradebook mutations occur only in APPLY_NOW, edit-by-date (via EDIT_EXISTING), schedule add/remove/clear, and recurring batch add.
@@ -63,11 +67,12 @@ from __future__ import annotations
 
 import calendar
 import datetime
+from bisect import bisect_left, insort
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import Enum
 from textwrap import dedent
-from typing import cast
+from typing import Literal, cast
 
 import cli.menu_helpers as helpers
 import cli.model_formatters as model_formatters
@@ -78,9 +83,33 @@ from core.response import ErrorCode
 from models.gradebook import Gradebook
 from models.student import AttendanceStatus, Student
 
+# `calendar.day_name` formats each lookup through the current locale, so resolve
+# the seven labels once at import.
+_DAY_NAMES = tuple(calendar.day_name)
+
+# intro text for `prompt_no_class_dates`, dedented once at import rather than per call
+_NO_CLASSES_INTRO = dedent("""\
+    If there are any dates in your recurring schedule where class is not held,
+    (e.g., holidays, in-service days, etc.) you may indicate those days here.
+
+    You can also add or remove specific dates from the schedule at any time 
+    via the Manage Course Schedule menu.
+    """)
+
+# one-letter codes accepted by the single-line status entry; "-" skips a student
+_STATUS_CODES: dict[str, AttendanceStatus | None] = {
+    "p": AttendanceStatus.PRESENT,
+    "a": AttendanceStatus.ABSENT,
+    "e": AttendanceStatus.EXCUSED_ABSENCE,
+    "l": AttendanceStatus.LATE,
+    "-": None,
+}
+
 
 class GatewayResponse(str, Enum):
     START_UNMARKED = "START_UNMARKED"
+    STAGE_ABSENT_BY_NUMBER = "STAGE_ABSENT_BY_NUMBER"
+    STAGE_FROM_STATUS_LINE = "STAGE_FROM_STATUS_LINE"
     STAGE_REMAINING_PRESENT = "STAGE_REMAINING_PRESENT"
     STAGE_REMAINING_ABSENT = "STAGE_REMAINING_ABSENT"
     EDIT_EXISTING = "EDIT_EXISTING"
@@ -103,7 +132,7 @@ class GatewayState:
 
     Args:
         class_date (datetime.date): The date being recorded.
-        active_roster (list[Student]): Active students for the date. Used for names, sorting, and ID indexing.
+        active_roster (Sequence[Student]): Active students for the date, already ordered by (last name, first name). Used for names, ordering, and ID indexing.
         gradebook_status_map (dict[str, AttendanceStatus]): The gradebook’s truth for the date (may include non‑active IDs).
         staged_status_map (dict[str, AttendanceStatus]): Per‑session staging (may include non‑active IDs and no‑ops).
 
@@ -135,14 +164,13 @@ class GatewayState:
     def __init__(
         self,
         class_date: datetime.date,
-        active_roster: list[Student],
+        active_roster: Sequence[Student],
         gradebook_status_map: dict[str, AttendanceStatus],
         staged_status_map: dict[str, AttendanceStatus],
     ) -> None:
         # --- roster/indexes for this render ---
-        self._active_roster: list[Student] = sorted(
-            active_roster, key=lambda x: (x.last_name, x.first_name)
-        )
+        # roster arrives pre-sorted from `Gradebook.active_students_sorted`
+        self._active_roster: list[Student] = list(active_roster)
         self._active_ids: set[str] = {s.id for s in self._active_roster}
         self._active_roster_count: int = len(self._active_roster)
 
@@ -189,11 +217,12 @@ class GatewayState:
         # (names are only for UI; IDs drive logic)
         roster_by_id = {student.id: student for student in self._active_roster}
 
-        unmarked_ids = {
+        # effective_status_map follows roster order, so this list is already sorted
+        unmarked_ids = [
             student_id
             for student_id, status in effective_status_map.items()
             if status == AttendanceStatus.UNMARKED
-        }
+        ]
 
         # --- store frozen snapshot ---
         self._active_roster_by_id: dict[str, Student] = roster_by_id
@@ -210,10 +239,7 @@ class GatewayState:
         self._staged_counts: dict[AttendanceStatus, int] = dict(staged_counts)
         self._effective_counts: dict[AttendanceStatus, int] = dict(effective_counts)
 
-        self._unmarked_ids = sorted(
-            unmarked_ids,
-            key=lambda x: (roster_by_id[x].last_name, roster_by_id[x].first_name),
-        )
+        self._unmarked_ids: list[str] = unmarked_ids
         self._unmarked_count: int = len(unmarked_ids)
 
         self._is_complete_preview: bool = self._unmarked_count == 0
@@ -364,20 +390,11 @@ def run(gradebook: Gradebook) -> None:
     Notes:
         - The finally block guarantees a check for unsaved changes before returning.
     """
-    title = formatters.format_banner_text("Manage Attendance")
-    options = [
-        ("Manage Class Schedule", manage_class_schedule),
-        ("Record Attendance", record_attendance),
-        ("Edit Attendance", edit_attendance),
-        ("View Attendance by Date", view_attendance_by_date),
-        ("View Attendance by Student", view_attendance_by_student),
-        ("Reset Attendance Data", reset_attendance_data),
-    ]
-    zero_option = "Return to Course Manager menu"
-
     try:
         while True:
-            menu_response = helpers.display_menu(title, options, zero_option)
+            menu_response = helpers.display_menu(
+                _RUN_TITLE, _RUN_OPTIONS, _RUN_ZERO_OPTION
+            )
 
             if menu_response is MenuSignal.EXIT:
                 break
@@ -409,17 +426,10 @@ def manage_class_schedule(gradebook: Gradebook):
         - Allows viewing, modifying, clearing, and generating the class schedule.
         - Returns control to the Manage Attendance menu when complete.
     """
-    title = formatters.format_banner_text("Manage Class Schedule")
-    options = [
-        ("View Current Schedule", view_current_schedule),
-        ("Add a Class Date", add_class_date),
-        ("Clear Entire Schedule", confirm_and_clear_schedule),
-        ("Generate a Recurring Schedule", generate_recurring_schedule),
-    ]
-    zero_option = "Return to Manage Attendance menu"
-
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
+        menu_response = helpers.display_menu(
+            _SCHEDULE_TITLE, _SCHEDULE_OPTIONS, _SCHEDULE_ZERO_OPTION
+        )
 
         if menu_response is MenuSignal.EXIT:
             break
@@ -460,22 +470,29 @@ def add_class_date(gradebook: Gradebook) -> None:
         - For each date, the user is shown a preview and asked to confirm before it is added.
         - Invalid or duplicate dates are rejected, with the reason displayed.
         - After each addition, the user is prompted to continue or return to the Manage Class Schedule menu.
+        - Dates already on the schedule are caught against a local snapshot before the preview, skipping the confirmation round-trip.
     """
+    scheduled_dates = gradebook.class_dates
+
     while True:
-        date_input = prompt_class_date_or_cancel()
+        new_date = prompt_class_date_or_cancel()
 
-        if date_input is MenuSignal.CANCEL:
+        if new_date is MenuSignal.CANCEL:
             break
 
-        new_date = cast(datetime.date, date_input)
+        if new_date in scheduled_dates:
+            print(
+                f"\n{formatters.format_class_date_short(new_date)} is already on the course schedule."
+            )
 
-        if preview_and_confirm_class_date(new_date):
+        elif preview_and_confirm_class_date(new_date):
             add_response = gradebook.add_class_date(new_date)
 
             if not add_response.success:
                 helpers.display_response_failure(add_response)
                 print("\nClass date was not added.")
             else:
+                scheduled_dates.add(new_date)
                 print(f"\n{add_response.detail}")
 
         if not helpers.confirm_action(
@@ -526,19 +543,17 @@ def remove_class_date(gradebook: Gradebook) -> None:
         - If a date is not found in the schedule, an error message is shown.
         - The user is prompted after each attempt to continue or return to the Manage Class Schedule menu.
     """
-    if not gradebook.class_dates:
+    if not gradebook.has_class_dates:
         print("\nThere are no scheduled class dates to remove.")
         helpers.returning_to("Manage Class Schedule menu")
         return
 
     while True:
-        date_input = prompt_class_date_or_cancel()
+        target_date = prompt_class_date_or_cancel()
 
-        if date_input is MenuSignal.CANCEL:
+        if target_date is MenuSignal.CANCEL:
             break
 
-        target_date = cast(datetime.date, date_input)
-
         if confirm_and_remove_class_date(target_date, gradebook):
             gradebook_response = gradebook.remove_class_date(target_date)
 
@@ -575,15 +590,15 @@ def confirm_and_remove_class_date(
         - The user is clearly informed that this action is destructive and cannot be undone.
         - No action is taken unless explicitly confirmed.
     """
-    if class_date not in gradebook.class_dates:
-        print(
-            f"\n{formatters.format_class_date_long(class_date)} is not in the course schedule."
-        )
+    date_label = formatters.format_class_date_long(class_date)
+
+    if not gradebook.is_class_date_scheduled(class_date):
+        print(f"\n{date_label} is not in the course schedule.")
         return False
 
     helpers.caution_banner()
     print("You are about to remove the following date from the course schedule:")
-    print(formatters.format_class_date_long(class_date))
+    print(date_label)
     print(
         "\nIf attendance has already been record for this date, that information will also be deleted from the gradebook."
     )
@@ -612,7 +627,7 @@ def confirm_and_clear_schedule(gradebook: Gradebook) -> None:
         - If successful, the class schedule and related attendance data are fully erased.
         - Returns to the Manage Class Schedule menu after completion.
     """
-    if not gradebook.class_dates:
+    if not gradebook.has_class_dates:
         print("\nThere are no scheduled class dates to remove.")
         helpers.returning_to("Manage Class Schedule menu")
         return
@@ -684,8 +699,12 @@ def generate_recurring_schedule(gradebook: Gradebook) -> None:
         no_classes_dates = prompt_no_class_dates()
 
     if no_classes_dates:
-        for off_day in no_classes_dates:
-            candidate_schedule.remove(off_day)
+        off_days = frozenset(no_classes_dates)
+        candidate_schedule = [
+            class_date
+            for class_date in candidate_schedule
+            if class_date not in off_days
+        ]
 
     if preview_and_confirm_course_schedule(candidate_schedule, no_classes_dates):
         gradebook_response = gradebook.batch_add_class_dates(candidate_schedule)
@@ -735,14 +754,20 @@ def populate_candidate_schedule(
     Notes:
         - Dates are returned in ascending order.
         - If no matches are found, the returned list will be empty.
+        - Each weekday is visited directly by jumping to its first occurrence and stepping a week at a time, rather than testing every day in the range.
     """
     candidate_schedule = []
-    pointer_date = start_date
+    one_week = datetime.timedelta(days=7)
+
+    for weekday in set(weekdays):
+        offset = (weekday - start_date.weekday()) % 7
+        pointer_date = start_date + datetime.timedelta(days=offset)
 
-    while pointer_date <= end_date:
-        if pointer_date.weekday() in weekdays:
+        while pointer_date <= end_date:
             candidate_schedule.append(pointer_date)
-        pointer_date += datetime.timedelta(days=1)
+            pointer_date += one_week
+
+    candidate_schedule.sort()
 
     return candidate_schedule
 
@@ -754,8 +779,8 @@ def preview_and_confirm_course_schedule(
     Previews the generated recurring schedule and allows the user to make manual adjustments.
 
     Args:
-        course_schedule (list[datetime.date]): A list of class dates initially generated based on user input.
-        off_days (list[datetime.date]): A list of dates excluded from the schedule (e.g., holidays).
+        course_schedule (list[datetime.date]): A sorted list of class dates initially generated based on user input.
+        off_days (list[datetime.date]): A sorted list of dates excluded from the schedule (e.g., holidays).
 
     Returns:
         - True if the user confirms the schedule and wants to proceed.
@@ -765,23 +790,32 @@ def preview_and_confirm_course_schedule(
         - Users may optionally add new dates not in the recurring pattern.
         - Users may remove dates from the schedule, which are added to the off-days list.
         - A final confirmation prompt is shown with a preview of both included and excluded dates.
+        - Membership checks run against a set mirror of `course_schedule`, kept in sync with every add and remove.
+        - Both lists are kept in sorted order with `bisect`, so the previews never re-sort.
+        - Each calendar view is rendered once and reused for the final preview unless an add or remove actually changed that list.
     """
+    scheduled_dates = set(course_schedule)
+    schedule_view: str | None = formatters.format_course_calendar(course_schedule)
+    off_days_view: str | None = formatters.format_course_calendar(off_days)
+
     print("\nYou have generated the following recurring course schedule:")
-    helpers.sort_and_display_course_dates(course_schedule)
+    print(schedule_view)
 
     if off_days:
         print("\nThe following dates have been marked as 'No Class' dates:")
-        helpers.sort_and_display_course_dates(set(off_days))
+        print(off_days_view)
 
     if helpers.confirm_action("Would you like to add any dates to this schedule?"):
         while True:
             print("\nSelect a new date to add to the schedule:")
-            class_date_input = prompt_class_date_or_cancel()
+            new_date = prompt_class_date_or_cancel()
 
-            if class_date_input is MenuSignal.CANCEL:
+            if new_date is MenuSignal.CANCEL:
                 break
-            elif class_date_input not in course_schedule:
-                course_schedule.append(cast(datetime.date, class_date_input))
+            elif new_date not in scheduled_dates:
+                insort(course_schedule, new_date)
+                scheduled_dates.add(new_date)
+                schedule_view = None
 
             if not helpers.confirm_action(
                 "Would you like to continue adding dates to the schedule?"
@@ -791,25 +825,37 @@ def preview_and_confirm_course_schedule(
     if helpers.confirm_action("Would you like to remove any dates from this schedule?"):
         while True:
             print("\nSelect an existing date to remove from the schedule:")
-            off_day_input = prompt_class_date_or_cancel()
+            off_day = prompt_class_date_or_cancel()
 
-            if off_day_input is MenuSignal.CANCEL:
+            if off_day is MenuSignal.CANCEL:
                 break
-            elif off_day_input in course_schedule:
-                course_schedule.remove(cast(datetime.date, off_day_input))
-                off_days.append(cast(datetime.date, off_day_input))
+            elif off_day in scheduled_dates:
+                del course_schedule[bisect_left(course_schedule, off_day)]
+                scheduled_dates.discard(off_day)
+                schedule_view = None
+
+                off_day_index = bisect_left(off_days, off_day)
+                if off_day_index == len(off_days) or off_days[off_day_index] != off_day:
+                    off_days.insert(off_day_index, off_day)
+                    off_days_view = None
 
             if not helpers.confirm_action(
                 "Would you like to continue removing dates from the schedule?"
             ):
                 break
 
+    if schedule_view is None:
+        schedule_view = formatters.format_course_calendar(course_schedule)
+
     print("\nYou are about to add the following dates to the course schedule")
-    helpers.sort_and_display_course_dates(course_schedule)
+    print(schedule_view)
 
     if off_days:
+        if off_days_view is None:
+            off_days_view = formatters.format_course_calendar(off_days)
+
         print("\nThe following dates have been marked as 'No Class' dates:")
-        helpers.sort_and_display_course_dates(set(off_days))
+        print(off_days_view)
 
     return helpers.confirm_action(
         "Would you like to add these dates to the course schedule?"
@@ -819,7 +865,7 @@ def preview_and_confirm_course_schedule(
 # === data input helpers ===
 
 
-def prompt_class_date_or_cancel() -> datetime.date | MenuSignal:
+def prompt_class_date_or_cancel() -> datetime.date | Literal[MenuSignal.CANCEL]:
     """
     Prompts the user to enter a class date in YYYY-MM-DD format or cancel the operation.
 
@@ -830,14 +876,15 @@ def prompt_class_date_or_cancel() -> datetime.date | MenuSignal:
     Notes:
         - Invalid formats trigger a validation message and re-prompt.
         - The prompt message includes formatting instructions and cancel guidance.
+        - The return type is narrowed to `MenuSignal.CANCEL`, so an `is MenuSignal.CANCEL` check leaves callers with a `datetime.date` and no `cast()`.
     """
     while True:
         date_input = helpers.prompt_user_input_or_cancel(
             "Enter the class date (YYYY-MM-DD, leave blank to cancel):"
         )
 
-        if isinstance(date_input, MenuSignal):
-            return date_input
+        if date_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
 
         try:
             return datetime.date.fromisoformat(date_input)
@@ -881,7 +928,7 @@ def prompt_class_date_from_schedule(gradebook: Gradebook) -> datetime.date | Men
 
         return format
 
-    class_dates = sorted(gradebook.class_dates)
+    class_dates = gradebook.class_dates_sorted
 
     if not class_dates:
         print("\nThere are no class dates in the course schedule to choose from.")
@@ -893,14 +940,7 @@ def prompt_class_date_from_schedule(gradebook: Gradebook) -> datetime.date | Men
     completed_dates = set()
     badges_enabled = False
 
-    gradebook_response = gradebook.get_records(
-        gradebook.students,
-        lambda x: x.is_active,
-    )
-
-    active_students = (
-        gradebook_response.data["records"] if gradebook_response.success else None
-    )
+    active_students = gradebook.active_students_sorted
 
     if active_students:
         badges_enabled = True
@@ -951,24 +991,20 @@ def prompt_start_and_end_dates() -> tuple[datetime.date, datetime.date] | MenuSi
 
         print("\nWhat is the first class date?")
 
-        start_date_input = prompt_class_date_or_cancel()
+        start_date = prompt_class_date_or_cancel()
 
-        if start_date_input is MenuSignal.CANCEL:
+        if start_date is MenuSignal.CANCEL:
             print("\nDiscarding dates and canceling schedule creator.")
             return MenuSignal.CANCEL
 
-        start_date = cast(datetime.date, start_date_input)
-
         print("\nWhat is the last class date?")
 
-        end_date_input = prompt_class_date_or_cancel()
+        end_date = prompt_class_date_or_cancel()
 
-        if end_date_input is MenuSignal.CANCEL:
+        if end_date is MenuSignal.CANCEL:
             print("\nDiscarding dates and canceling schedule creator.")
             return MenuSignal.CANCEL
 
-        end_date = cast(datetime.date, end_date_input)
-
         if not start_date < end_date:
             print("\nInvalid entry. The end date must come after the start date.")
             print("Please try again.")
@@ -1004,36 +1040,28 @@ def prompt_weekdays_or_cancel() -> list[int] | MenuSignal:
         - The user may add days interactively, one at a time.
         - Selected days are previewed before confirmation.
         - If no days are selected, the user is prompted to retry or cancel.
-        - Uses `calendar.day_name` to display human-readable day names.
+        - Uses the cached `_DAY_NAMES` labels to display human-readable day names.
+        - Selections are kept in a sorted, duplicate-free list via `insort`, so no re-sorting is needed for display or return.
     """
-    title = "\nChoose a day of the week to add to your schedule:"
-    options = [
-        ("Monday", lambda: 0),
-        ("Tuesday", lambda: 1),
-        ("Wednesday", lambda: 2),
-        ("Thursday", lambda: 3),
-        ("Friday", lambda: 4),
-        ("Saturday", lambda: 5),
-        ("Sunday", lambda: 6),
-    ]
-    zero_option = "Cancel without adding a new day"
-
     while True:
-        weekdays = set()
+        weekdays: list[int] = []
         print("\nSelect which days of the week you meet for class:")
 
         while True:
             if weekdays:
                 print("\nYou have already selected the following days:")
-                for day in sorted(weekdays):
-                    print(f" - {calendar.day_name[day]}")
+                for day in weekdays:
+                    print(f" - {_DAY_NAMES[day]}")
 
-            menu_response = helpers.display_menu(title, options, zero_option)
+            menu_response = helpers.display_menu(
+                _WEEKDAY_TITLE, _WEEKDAY_OPTIONS, _WEEKDAY_ZERO_OPTION
+            )
 
             if menu_response is MenuSignal.EXIT:
                 break
-            elif callable(menu_response):
-                weekdays.add(menu_response())
+            elif isinstance(menu_response, int):
+                if menu_response not in weekdays:
+                    insort(weekdays, menu_response)
             else:
                 raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
@@ -1053,13 +1081,13 @@ def prompt_weekdays_or_cancel() -> list[int] | MenuSignal:
 
         else:
             print(
-                f"\nYou have selected {formatters.format_list_with_and([calendar.day_name[day] for day in sorted(weekdays)])}"
+                f"\nYou have selected {formatters.format_list_with_and(_DAY_NAMES[day] for day in weekdays)}"
             )
 
         if helpers.confirm_action(
             "Would you like to use these days for your recurring schedule?"
         ):
-            return list(sorted(weekdays))
+            return weekdays
         elif helpers.confirm_action(
             "Would you like to start over and try choosing days again?"
         ):
@@ -1084,20 +1112,10 @@ def prompt_no_class_dates() -> list[datetime.date]:
         - Dates are not validated against the generated schedule in this prompt.
         - Cancel during selection returns to confirmation with the current selection; cancel at the final prompt returns an empty list.
     """
-    print(
-        dedent(
-            """\
-            If there are any dates in your recurring schedule where class is not held,
-            (e.g., holidays, in-service days, etc.) you may indicate those days here.
-
-            You can also add or remove specific dates from the schedule at any time 
-            via the Manage Course Schedule menu.
-            """
-        )
-    )
+    print(_NO_CLASSES_INTRO)
 
     while True:
-        no_class_dates = set()
+        no_class_dates: dict[datetime.date, None] = {}
         print("\nSelect which dates to omit from the recurring schedule:")
 
         while True:
@@ -1113,7 +1131,7 @@ def prompt_no_class_dates() -> list[datetime.date]:
             if new_off_day is MenuSignal.CANCEL:
                 break
             else:
-                no_class_dates.add(new_off_day)
+                no_class_dates[new_off_day] = None
 
             if not helpers.confirm_action(
                 "Would you like to add another 'No Class' date?"
@@ -1136,7 +1154,7 @@ def prompt_no_class_dates() -> list[datetime.date]:
         if helpers.confirm_action(
             "Would you like to exclude these dates from your recurring schedule?"
         ):
-            return list(sorted(no_class_dates))
+            return sorted(no_class_dates)
         elif helpers.confirm_action(
             "Would you like to start over and try choosing 'No Class' dates again?"
         ):
@@ -1146,6 +1164,94 @@ def prompt_no_class_dates() -> list[datetime.date]:
             return []
 
 
+def prompt_roster_numbers_or_cancel(
+    roster_size: int,
+) -> list[int] | Literal[MenuSignal.CANCEL]:
+    """
+    Prompts the user for a set of roster numbers entered on a single line.
+
+    Args:
+        roster_size (int): The number of students in the displayed roster.
+
+    Returns:
+        - A sorted, de-duplicated list of 1-based roster numbers.
+        - `MenuSignal.CANCEL` if the user leaves the input blank.
+
+    Notes:
+        - Numbers may be separated by commas, spaces, or both (e.g., "2, 5 9").
+        - Non-numeric or out-of-range entries trigger a validation message and re-prompt.
+    """
+    while True:
+        numbers_input = helpers.prompt_user_input_or_cancel(
+            "Enter the numbers of the absent students, separated by commas or spaces (leave blank to cancel):"
+        )
+
+        if numbers_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
+
+        tokens = numbers_input.replace(",", " ").split()
+
+        try:
+            numbers = {int(token) for token in tokens}
+        except ValueError:
+            print("\nInvalid entry. Please enter roster numbers only.")
+            continue
+
+        if not all(1 <= number <= roster_size for number in numbers):
+            print(
+                f"\nInvalid entry. Roster numbers must be between 1 and {roster_size}."
+            )
+            continue
+
+        return sorted(numbers)
+
+
+def prompt_status_line_or_cancel(
+    roster_size: int,
+) -> list[AttendanceStatus | None] | Literal[MenuSignal.CANCEL]:
+    """
+    Prompts the user for one attendance code per student, entered on a single line.
+
+    Args:
+        roster_size (int): The number of students in the displayed roster.
+
+    Returns:
+        - A list of `AttendanceStatus` values in roster order, with None for skipped students.
+        - `MenuSignal.CANCEL` if the user leaves the input blank.
+
+    Notes:
+        - Codes are case-insensitive: P (Present), A (Absent), E (Excused), L (Late), "-" (skip).
+        - Codes may be separated by spaces or commas ("p a p -") or run together ("pap-").
+        - The number of codes must match `roster_size`; otherwise the user is re-prompted.
+    """
+    while True:
+        line_input = helpers.prompt_user_input_or_cancel(
+            "Enter one code per student in roster order (P = Present, A = Absent, E = Excused, L = Late, - = Skip; leave blank to cancel):"
+        )
+
+        if line_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
+
+        tokens = line_input.replace(",", " ").lower().split()
+
+        if len(tokens) == 1 and len(tokens[0]) == roster_size:
+            tokens = list(tokens[0])
+
+        if len(tokens) != roster_size:
+            print(
+                f"\nInvalid entry. Expected {roster_size} codes but received {len(tokens)}."
+            )
+            continue
+
+        unknown_codes = [token for token in tokens if token not in _STATUS_CODES]
+
+        if unknown_codes:
+            print(f"\nInvalid entry. Unrecognized codes: {', '.join(unknown_codes)}")
+            continue
+
+        return [_STATUS_CODES[token] for token in tokens]
+
+
 # === record attendance ===
 
 
@@ -1161,6 +1267,10 @@ def record_attendance(gradebook: Gradebook) -> None:
             - Show the gateway menu with `prompt_gateway_response(state)` and dispatch on the returned `GatewayResponse`:
                 - START_UNMARKED
                     - Run `start_unmarked(state)` to walk unmarked students one-by-one, staging selections (Present/Absent/Excused/Late). Offers an apply/discard/keep guard if the user cancels mid-pass.
+                - STAGE_ABSENT_BY_NUMBER
+                    - Run `stage_absent_by_number(state)` to list unmarked students once and read the absent roster numbers in a single entry, staging the rest as Present.
+                - STAGE_FROM_STATUS_LINE
+                    - Run `stage_from_status_line(state)` to list unmarked students once and read one status code per student in a single entry.
                 - STAGE_REMAINING_PRESENT / STAGE_REMAINING_ABSENT
                     - Run `stage_remaining(status, state)` to bulk-stage the chosen status for all currently unmarked students, with an optional apply-now prompt.
                 - EDIT_EXISTING
@@ -1192,7 +1302,7 @@ def record_attendance(gradebook: Gradebook) -> None:
         Build a `GatewayState` snapshot for the given date, or bail with user feedback.
 
         Pulls:
-            - Active students via `gradebook.get_records(..., is_active)`.
+            - Active students, pre-sorted and cached, via `gradebook.active_students_sorted`.
             - Gradebook attendance map for the date via `gradebook.get_attendance_for_date(active_only=True)`.
             - Current staged map from the outer `stager`.
 
@@ -1203,18 +1313,7 @@ def record_attendance(gradebook: Gradebook) -> None:
         Notes:
             - Prints error/diagnostic messages on failure. Does not mutate gradebook state.
         """
-        gradebook_response = gradebook.get_records(
-            dictionary=gradebook.students,
-            predicate=lambda x: x.is_active,
-        )
-
-        if not gradebook_response.success:
-            helpers.display_response_failure(gradebook_response)
-            print("Unable to retrieve active students.")
-            helpers.returning_without_changes()
-            return
-
-        active_students = gradebook_response.data["records"]
+        active_students = gradebook.active_students_sorted
 
         gradebook_response = gradebook.get_attendance_for_date(
             class_date=date,
@@ -1274,17 +1373,11 @@ def record_attendance(gradebook: Gradebook) -> None:
             student = roster_by_id[student_id]
 
             title = f"{student.full_name}:"
-            options = [
-                ("Present", lambda: AttendanceStatus.PRESENT),
-                ("Absent", lambda: AttendanceStatus.ABSENT),
-                ("Excused", lambda: AttendanceStatus.EXCUSED_ABSENCE),
-                ("Late", lambda: AttendanceStatus.LATE),
-                ("Skip this student", MenuSignal.SKIP),
-            ]
-            zero_option = "Cancel and stop recording attendance"
 
             while True:
-                menu_response = helpers.display_menu(title, options, zero_option)
+                menu_response = helpers.display_menu(
+                    title, _STATUS_OPTIONS, _STATUS_ZERO_OPTION
+                )
 
                 if menu_response is MenuSignal.EXIT:
                     if staged_count == 0:
@@ -1332,8 +1425,8 @@ def record_attendance(gradebook: Gradebook) -> None:
                 elif menu_response is MenuSignal.SKIP:
                     break
 
-                elif callable(menu_response):
-                    status = menu_response()
+                elif isinstance(menu_response, AttendanceStatus):
+                    status = menu_response
 
                     gradebook_status = state.gradebook_map.get(
                         student_id, AttendanceStatus.UNMARKED
@@ -1369,6 +1462,146 @@ def record_attendance(gradebook: Gradebook) -> None:
                 )
                 return
 
+    def display_unmarked_roster(state: GatewayState) -> None:
+        """
+        Print the unmarked students for `state.class_date` as a numbered list, in roster order, under a single banner.
+        """
+        roster_by_id = state.active_roster_by_id
+        banner = f"Attendance for {state.date_label_short}"
+        roster_lines = [
+            f"{i:>3}. {roster_by_id[student_id].full_name}"
+            for i, student_id in enumerate(state.unmarked_ids, 1)
+        ]
+        print(f"\n{formatters.format_banner_text(banner)}\n")
+        print("\n".join(roster_lines))
+
+    def stage_absent_by_number(state: GatewayState) -> None:
+        """
+        Stage all unmarked students from a single entry of absent roster numbers.
+
+        Behavior:
+            - Prints the unmarked roster once, numbered in roster order.
+            - Reads the absent students' numbers in one prompt via `prompt_roster_numbers_or_cancel(...)`.
+            - After confirmation, bulk-stages the selected students as Absent and every other unmarked student as Present.
+            - Offers to apply the changes immediately via `apply_now(state.class_date)`; otherwise returns to the gateway with staging intact.
+
+        Notes:
+            - Replaces one menu round-trip per student with one prompt for the whole roster.
+            - No gradebook writes occur unless the user chooses to apply now.
+        """
+        target_ids = state.unmarked_ids
+        roster_by_id = state.active_roster_by_id
+
+        if not target_ids:
+            print("All students are marked. Nothing to record.")
+            return
+
+        display_unmarked_roster(state)
+
+        absent_numbers = prompt_roster_numbers_or_cancel(len(target_ids))
+
+        if absent_numbers is MenuSignal.CANCEL:
+            helpers.returning_without_changes()
+            return
+
+        absent_ids = [target_ids[number - 1] for number in absent_numbers]
+        absent_id_set = set(absent_ids)
+        present_ids = [
+            student_id for student_id in target_ids if student_id not in absent_id_set
+        ]
+
+        print(
+            f"\nYou have marked {len(absent_ids)} of {len(target_ids)} students absent:"
+        )
+        for student_id in absent_ids:
+            print(f"... {roster_by_id[student_id].full_name}")
+
+        if not helpers.confirm_action(
+            f"Would you like to stage these students as 'Absent' and the remaining {len(present_ids)} as 'Present'?"
+        ):
+            helpers.returning_without_changes()
+            return
+
+        stager.bulk_stage(absent_ids, AttendanceStatus.ABSENT, overwrite=True)
+        stager.bulk_stage(present_ids, AttendanceStatus.PRESENT, overwrite=True)
+
+        print(
+            f"\nStaged {len(absent_ids)} absent and {len(present_ids)} present on {state.date_label_short}."
+        )
+        print("These changes are not immediately applied to the gradebook.")
+
+        if helpers.confirm_action("Would you like to apply these changes now?"):
+            apply_now(state.class_date)
+        else:
+            print(
+                "You may apply these changes later by selecting 'Apply Staged Changes Now' from the Record Attendance menu."
+            )
+
+    def stage_from_status_line(state: GatewayState) -> None:
+        """
+        Stage unmarked students from a single line of per-student status codes.
+
+        Behavior:
+            - Prints the unmarked roster once, numbered in roster order.
+            - Reads one code per student via `prompt_status_line_or_cancel(...)`: P(resent), A(bsent), E(xcused), L(ate), or "-" to skip.
+            - Previews the resulting statuses and, after confirmation, stages them.
+            - Offers to apply the changes immediately via `apply_now(state.class_date)`; otherwise returns to the gateway with staging intact.
+
+        Notes:
+            - Skipped students remain unmarked and can be recorded on a later pass.
+            - No gradebook writes occur unless the user chooses to apply now.
+        """
+        target_ids = state.unmarked_ids
+        roster_by_id = state.active_roster_by_id
+
+        if not target_ids:
+            print("All students are marked. Nothing to record.")
+            return
+
+        display_unmarked_roster(state)
+
+        statuses_input = prompt_status_line_or_cancel(len(target_ids))
+
+        if statuses_input is MenuSignal.CANCEL:
+            helpers.returning_without_changes()
+            return
+
+        changes = [
+            (student_id, status)
+            for student_id, status in zip(target_ids, statuses_input)
+            if status is not None
+        ]
+
+        if not changes:
+            print("\nEvery student was skipped.")
+            helpers.returning_without_changes()
+            return
+
+        print("\nYou have entered the following statuses:")
+        for student_id, status in changes:
+            print(f"... {roster_by_id[student_id].full_name:<20} | {status.value}")
+
+        if not helpers.confirm_action(
+            f"Would you like to stage these {len(changes)} {'change' if len(changes) == 1 else 'changes'}?"
+        ):
+            helpers.returning_without_changes()
+            return
+
+        for student_id, status in changes:
+            stager.stage(student_id, status)
+
+        print(
+            f"\nStaged updates for {len(changes)} {'student' if len(changes) == 1 else 'students'} on {state.date_label_short}."
+        )
+        print("These changes are not immediately applied to the gradebook.")
+
+        if helpers.confirm_action("Would you like to apply these changes now?"):
+            apply_now(state.class_date)
+        else:
+            print(
+                "You may apply these changes later by selecting 'Apply Staged Changes Now' from the Record Attendance menu."
+            )
+
     def stage_remaining(status: AttendanceStatus, state: GatewayState) -> None:
         """
         Bulk-stage the given `status` for all currently unmarked students.
@@ -1792,6 +2025,14 @@ def record_attendance(gradebook: Gradebook) -> None:
                 start_unmarked(gateway_state)
                 continue
 
+            case GatewayResponse.STAGE_ABSENT_BY_NUMBER:
+                stage_absent_by_number(gateway_state)
+                continue
+
+            case GatewayResponse.STAGE_FROM_STATUS_LINE:
+                stage_from_status_line(gateway_state)
+                continue
+
             case GatewayResponse.STAGE_REMAINING_PRESENT:
                 stage_remaining(AttendanceStatus.PRESENT, gateway_state)
                 continue
@@ -1882,7 +2123,7 @@ def resolve_class_date(gradebook: Gradebook) -> datetime.date | MenuSignal:
                 else:
                     continue
 
-            if class_date not in gradebook.class_dates:
+            if not gradebook.is_class_date_scheduled(class_date):
                 print(
                     f"\n{formatters.format_class_date_long(class_date)} is not in the course schedule."
                 )
@@ -1926,6 +2167,8 @@ def build_gateway_options(
 
     Inserts actions in a stable, intentional order:
       - Start recording unmarked (per-student loop), when any unmarked remain.
+      - Mark absences by roster number (single entry), when any unmarked remain.
+      - Enter statuses on a single line (one code per student), when any unmarked remain.
       - Bulk stage remaining as Present/Absent, when any unmarked remain.
       - Edit existing statuses, when the gradebook already has marks.
       - Apply staged changes, when staging is non-empty.
@@ -1947,6 +2190,18 @@ def build_gateway_options(
         options.append(
             ("Start recording unmarked", lambda: GatewayResponse.START_UNMARKED)
         )
+        options.append(
+            (
+                "Mark absences by roster number",
+                lambda: GatewayResponse.STAGE_ABSENT_BY_NUMBER,
+            )
+        )
+        options.append(
+            (
+                "Enter statuses on a single line",
+                lambda: GatewayResponse.STAGE_FROM_STATUS_LINE,
+            )
+        )
 
     if gateway_state.can_mark_remaining_present:
         options.append(
@@ -2598,7 +2853,7 @@ def prompt_find_class_date(gradebook: Gradebook) -> datetime.date | MenuSignal:
                 else:
                     continue
 
-            if class_date not in gradebook.class_dates:
+            if not gradebook.is_class_date_scheduled(class_date):
                 print("\nYou have selected a date not found in the course schedule.")
                 print(
                     "You will be able to erase attendance data for this date, but you cannot record attendance data until it has been added to the course schedule."
@@ -2640,16 +2895,10 @@ def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
         - Assumes each helper return either a `Student` or `MenuSignal.CANCEL`.
         - Returns early if the user chooses to cancel or no selection is made.
     """
-    title = formatters.format_banner_text("Student Selection")
-    options = [
-        ("Search for a student", helpers.find_student_by_search),
-        ("Select from active students", helpers.find_active_student_from_list),
-        ("Select from inactive students", helpers.find_inactive_student_from_list),
-    ]
-    zero_option = "Return and cancel"
-
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
+        menu_response = helpers.display_menu(
+            _FIND_STUDENT_TITLE, _FIND_STUDENT_OPTIONS, _FIND_STUDENT_ZERO_OPTION
+        )
 
         if menu_response is MenuSignal.EXIT:
             return MenuSignal.CANCEL
@@ -2669,3 +2918,51 @@ def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
 
         else:
             raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+
+
+# === menu option tables ===
+#
+# Static menus are built once at import time. They live at the bottom of the
+# module because each table references handlers defined above.
+
+_RUN_TITLE = formatters.format_banner_text("Manage Attendance")
+_RUN_OPTIONS = (
+    ("Manage Class Schedule", manage_class_schedule),
+    ("Record Attendance", record_attendance),
+    ("Edit Attendance", edit_attendance),
+    ("View Attendance by Date", view_attendance_by_date),
+    ("View Attendance by Student", view_attendance_by_student),
+    ("Reset Attendance Data", reset_attendance_data),
+)
+_RUN_ZERO_OPTION = "Return to Course Manager menu"
+
+_SCHEDULE_TITLE = formatters.format_banner_text("Manage Class Schedule")
+_SCHEDULE_OPTIONS = (
+    ("View Current Schedule", view_current_schedule),
+    ("Add a Class Date", add_class_date),
+    ("Clear Entire Schedule", confirm_and_clear_schedule),
+    ("Generate a Recurring Schedule", generate_recurring_schedule),
+)
+_SCHEDULE_ZERO_OPTION = "Return to Manage Attendance menu"
+
+# value menus map each label straight to its result, so no closure is needed
+_WEEKDAY_TITLE = "\nChoose a day of the week to add to your schedule:"
+_WEEKDAY_OPTIONS = tuple((day_name, day) for day, day_name in enumerate(_DAY_NAMES))
+_WEEKDAY_ZERO_OPTION = "Cancel without adding a new day"
+
+_STATUS_OPTIONS = (
+    ("Present", AttendanceStatus.PRESENT),
+    ("Absent", AttendanceStatus.ABSENT),
+    ("Excused", AttendanceStatus.EXCUSED_ABSENCE),
+    ("Late", AttendanceStatus.LATE),
+    ("Skip this student", MenuSignal.SKIP),
+)
+_STATUS_ZERO_OPTION = "Cancel and stop recording attendance"
+
+_FIND_STUDENT_TITLE = formatters.format_banner_text("Student Selection")
+_FIND_STUDENT_OPTIONS = (
+    ("Search for a student", helpers.find_student_by_search),
+    ("Select from active students", helpers.find_active_student_from_list),
+    ("Select from inactive students", helpers.find_inactive_student_from_list),
+)
+_FIND_STUDENT_ZERO_OPTION = "Return and cancel"
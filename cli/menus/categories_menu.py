@@ -13,18 +13,24 @@ All operations are routed through the `Gradebook` API for consistency, validatio
 Control flow adheres to structured CLI menu patterns with clear terminal-level feedback.
 """
 
-from collections.abc import Callable
-from typing import cast
+from collections.abc import Callable, Collection
+from typing import Literal
 
 import cli.menu_helpers as helpers
 import cli.menus.weights_menu as weights_menu
 import cli.model_formatters as model_formatters
 import core.formatters as formatters
 from cli.menu_helpers import MenuSignal
+from core.response import ErrorCode
 from core.utils import generate_uuid
 from models.category import Category
 from models.gradebook import Gradebook
 
+# the view banners never change, so render them once at import
+_ACTIVE_CATEGORIES_BANNER = formatters.format_banner_text("Active Categories")
+_INACTIVE_CATEGORIES_BANNER = formatters.format_banner_text("Inactive Categories")
+_ALL_CATEGORIES_BANNER = formatters.format_banner_text("All Categories")
+
 
 def run(gradebook: Gradebook) -> None:
     """
@@ -39,26 +45,8 @@ def run(gradebook: Gradebook) -> None:
     Notes:
         - The finally block guarantees a check for unsaved changes before returning.
     """
-    title = formatters.format_banner_text("Manage Categories")
-    options = [
-        ("Add Category", add_category),
-        ("Edit Category", find_and_edit_category),
-        ("Remove Category", find_and_remove_category),
-        ("View Categories", view_categories_menu),
-        ("Manage Category Weights", weights_menu.run),
-    ]
-    zero_option = "Return to Course Manager menu"
-
     try:
-        while True:
-            menu_response = helpers.display_menu(title, options, zero_option)
-
-            if menu_response is MenuSignal.EXIT:
-                break
-            elif callable(menu_response):
-                menu_response(gradebook)
-            else:
-                raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+        helpers.run_menu_loop(_RUN_TITLE, _RUN_OPTIONS, _RUN_ZERO_OPTION, gradebook)
 
     finally:
         helpers.prompt_if_dirty(gradebook)
@@ -71,54 +59,78 @@ def run(gradebook: Gradebook) -> None:
 
 def add_category(gradebook: Gradebook) -> None:
     """
-    Loops a prompt to create a new `Category` object and add it to the gradebook.
+    Loops a prompt to create new `Category` objects, then adds them to the gradebook as one batch.
 
     Args:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
+        - Confirmed categories are queued and added together via `Gradebook.batch_add_categories()` once the user stops adding.
+        - Names are checked against queued categories as well as saved ones, both when first entered and when renamed in the preview, so a duplicate is rejected at the prompt rather than dropped from the batch.
         - Additions are not saved automatically. If the gradebook is marked dirty after adding, the user will be prompted to save before returning to the previous menu.
     """
+    queued_categories: list[Category] = []
+    queued_names: list[str] = []
+
     while True:
-        new_category = prompt_new_category(gradebook)
+        new_category = prompt_new_category(gradebook, queued_names)
 
         if new_category is not None and preview_and_confirm_category(
-            new_category, gradebook
+            new_category, gradebook, queued_names
         ):
-            gradebook_response = gradebook.add_category(new_category)
-
-            if not gradebook_response.success:
-                helpers.display_response_failure(gradebook_response)
-                print(f"\n{new_category.name} was not added.")
-            else:
-                print(f"\n{gradebook_response.detail}")
+            queued_categories.append(new_category)
+            queued_names.append(new_category.name)
+            print(f"\n{new_category.name} will be added when you finish.")
 
         if not helpers.confirm_action(
             "Would you like to continue adding new categories?"
         ):
             break
 
+    if queued_categories:
+        gradebook_response = gradebook.batch_add_categories(queued_categories)
+
+        added_categories = gradebook_response.data["success"]
+        skipped_categories = gradebook_response.data["failure"]
+
+        if not gradebook_response.success:
+            helpers.display_response_failure(gradebook_response)
+
+            # an unexpected error can stop the batch partway, so report what landed
+            print(
+                f"{len(added_categories)} of {len(queued_categories)} categories were added."
+            )
+
+            if gradebook_response.error is ErrorCode.VALIDATION_FAILED:
+                print(
+                    f"Skipped due to duplicate names: {', '.join(c.name for c in skipped_categories)}"
+                )
+
+        else:
+            print(f"\n{gradebook_response.detail}")
+
     helpers.prompt_if_dirty(gradebook)
     helpers.returning_to("Manage Categories menu")
 
 
-def prompt_new_category(gradebook: Gradebook) -> Category | None:
+def prompt_new_category(
+    gradebook: Gradebook, queued_names: Collection[str] = ()
+) -> Category | None:
     """
     Creates a new `Category` object.
 
     Args:
         gradebook (Gradebook): The active `Gradebook`.
+        queued_names (Collection[str]): Names of categories queued but not yet added. Defaults to none.
 
     Returns:
         A new `Category` object, or None.
     """
-    name_input = prompt_name_input_or_cancel(gradebook)
+    name = prompt_name_input_or_cancel(gradebook, queued_names)
 
-    if name_input is MenuSignal.CANCEL:
+    if name is MenuSignal.CANCEL:
         return None
 
-    name = cast(str, name_input)
-
     try:
         return Category(
             id=generate_uuid(),
@@ -130,24 +142,46 @@ def prompt_new_category(gradebook: Gradebook) -> Category | None:
         return None
 
 
-def preview_and_confirm_category(category: Category, gradebook: Gradebook) -> bool:
+def preview_and_confirm_category(
+    category: Category, gradebook: Gradebook, queued_names: Collection[str] = ()
+) -> bool:
     """
     Previews new `Category` details, offers opportunity to edit details, and prompts user for confirmation.
 
     Args:
         category (Category): The `Category` object under review.
         gradebook (Gradebook): The active `Gradebook`.
+        queued_names (Collection[str]): Names of categories queued but not yet added, which a rename may not reuse. Defaults to none.
 
     Returns:
         True if user confirms the `Category` details, and False otherwise.
+
+    Notes:
+        - The preview is rendered once. The edit menu is entered without repeating it, and the preview is shown again only if an edit actually changed it.
     """
-    print("\nYou are about to create the following category:")
-    print(model_formatters.format_category_multiline(category, gradebook))
+    preview = model_formatters.format_category_multiline(category, gradebook)
+
+    print(f"\nYou are about to create the following category:\n{preview}")
 
     if helpers.confirm_action(
         "Would you like to edit this category first (change the name or mark as archived)?"
     ):
-        edit_category(category, gradebook, "Category creation preview")
+        edit_category(
+            category,
+            gradebook,
+            "Category creation preview",
+            show_summary=False,
+            queued_names=queued_names,
+        )
+
+        updated_preview = model_formatters.format_category_multiline(
+            category, gradebook
+        )
+
+        if updated_preview != preview:
+            print(
+                f"\nYou are about to create the following category:\n{updated_preview}"
+            )
 
     if helpers.confirm_action("Would you like to create this category?"):
         return True
@@ -159,29 +193,37 @@ def preview_and_confirm_category(category: Category, gradebook: Gradebook) -> bo
 # === data input helpers ===
 
 
-def prompt_name_input_or_cancel(gradebook: Gradebook) -> str | MenuSignal:
+def prompt_name_input_or_cancel(
+    gradebook: Gradebook,
+    queued_names: Collection[str] = (),
+    exempt_id: str | None = None,
+) -> str | Literal[MenuSignal.CANCEL]:
     """
     Solicits user input for category name, validates uniqueness, and treats a blank input as 'cancel'.
 
     Args:
         gradebook (Gradebook): The active `Gradebook`.
+        queued_names (Collection[str]): Names of categories queued but not yet added, which are also rejected. Defaults to none.
+        exempt_id (str | None): The id of the category being renamed, so re-entering its own name is not a conflict. Defaults to None.
 
     Returns:
         User input unmodified, or `MenuSignal.CANCEL` if input is "".
 
     Notes:
-        - The only validation is the call to `require_unique_category_name()`. Defensive validation against malicious input is missing.
+        - The only validation is the call to `require_unique_category_name()`, which also covers `queued_names`. Defensive validation against malicious input is missing.
     """
     while True:
         name_input = helpers.prompt_user_input_or_cancel(
             "Enter category name (leave blank to cancel):"
         )
 
-        if isinstance(name_input, MenuSignal):
-            return name_input
+        if name_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
 
         try:
-            gradebook.require_unique_category_name(name_input)
+            gradebook.require_unique_category_name(
+                name_input, exempt_id=exempt_id, also_reject=queued_names
+            )
             return name_input
 
         except ValueError as e:
@@ -192,19 +234,6 @@ def prompt_name_input_or_cancel(gradebook: Gradebook) -> str | MenuSignal:
 # === edit category ===
 
 
-def get_editable_fields() -> list[tuple[str, Callable[[Category, Gradebook], None]]]:
-    """
-    Helper method to organize the list of editable fields and their related functions.
-
-    Returns:
-        A list of `(field_name, edit_function)` tuples used to prompt and edit `Category` attributes.
-    """
-    return [
-        ("Name", edit_name_and_confirm),
-        ("Archived Status", edit_active_status_and_confirm),
-    ]
-
-
 def find_and_edit_category(gradebook: Gradebook) -> None:
     """
     Prompts user to search for a `Category` and then passes the result to `edit_category()`.
@@ -212,13 +241,11 @@ def find_and_edit_category(gradebook: Gradebook) -> None:
     Args:
         gradebook (Gradebook): The active `Gradebook`.
     """
-    category_input = prompt_find_category(gradebook)
+    category = prompt_find_category(gradebook)
 
-    if category_input is MenuSignal.CANCEL:
+    if category is MenuSignal.CANCEL:
         return
 
-    category = cast(Category, category_input)
-
     edit_category(category, gradebook)
 
 
@@ -226,6 +253,8 @@ def edit_category(
     category: Category,
     gradebook: Gradebook,
     return_context: str = "Manage Categories menu",
+    show_summary: bool = True,
+    queued_names: Collection[str] = (),
 ) -> None:
     """
     Interface for editing fields of a `Category` record.
@@ -234,6 +263,8 @@ def edit_category(
         category (Category): The `Category` object being edited.
         gradebook (Gradebook): The active `Gradebook`.
         return_context (str): An optional description of the call site, uses "Manage Categories menu" by default.
+        show_summary (bool): If False, skips the opening multi-line summary because the caller has just displayed it. Defaults to True.
+        queued_names (Collection[str]): Names of categories queued but not yet added, forwarded to the field editors so a rename cannot reuse them. Defaults to none.
 
     Raise:
         RuntimeError: If the menu response is unrecognized.
@@ -243,22 +274,20 @@ def edit_category(
         - Changes are not saved automatically. If the gradebook is marked dirty after edits, the user will be prompted to save before returning to the previous menu.
         - The `return_context` label is used to display a confirmation message when exiting the edit menu.
     """
-    print("\nYou are editing the following category:")
-    print(model_formatters.format_category_multiline(category, gradebook))
-
-    title = formatters.format_banner_text("Editable Fields")
-    options = get_editable_fields()
-    zero_option = "Finish editing and return"
+    if show_summary:
+        print("\nYou are editing the following category:")
+        print(model_formatters.format_category_multiline(category, gradebook))
 
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
-
-        if menu_response is MenuSignal.EXIT:
+        if not helpers.dispatch_menu_selection(
+            _EDIT_TITLE,
+            _EDITABLE_FIELDS,
+            _EDIT_ZERO_OPTION,
+            category,
+            gradebook,
+            queued_names,
+        ):
             break
-        elif callable(menu_response):
-            menu_response(category, gradebook)
-        else:
-            raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
         if not helpers.confirm_action(
             "Would you like to continue editing this category?"
@@ -267,32 +296,39 @@ def edit_category(
 
     if gradebook.has_unsaved_changes:
         helpers.prompt_if_dirty(gradebook)
+        helpers.returning_to(return_context)
     else:
-        helpers.returning_without_changes()
-
-    helpers.returning_to(return_context)
+        helpers.returning_to(return_context, without_changes=True)
 
 
-def edit_name_and_confirm(category: Category, gradebook: Gradebook) -> None:
+def edit_name_and_confirm(
+    category: Category, gradebook: Gradebook, queued_names: Collection[str] = ()
+) -> None:
     """
     Prompts for a new name and updates the `Category` record via `Gradebook`.
 
     Args:
         category (Category): The `Category` object targeted for editing.
         gradebook (Gradebook): The active `Gradebook`.
+        queued_names (Collection[str]): Names of categories queued but not yet added, which the new name may not reuse. Defaults to none.
 
     Notes:
-        - Cancels early if the user enters nothing or declines the confirmation.
+        - Cancels early if the user enters nothing, re-enters the current name, or declines the confirmation.
         - Uses `Gradebook.update_category_name()` to perform the update and track changes.
     """
     current_name = category.name
-    name_input = prompt_name_input_or_cancel(gradebook)
+    new_name = prompt_name_input_or_cancel(
+        gradebook, queued_names, exempt_id=category.id
+    )
 
-    if name_input is MenuSignal.CANCEL:
+    if new_name is MenuSignal.CANCEL:
         helpers.returning_without_changes()
         return
 
-    new_name = cast(str, name_input)
+    if new_name == current_name:
+        print("\nThe name entered matches the current one.")
+        helpers.returning_without_changes()
+        return
 
     print(f"\nCurrent category name: {current_name} -> New category name: {new_name}")
 
@@ -311,13 +347,16 @@ def edit_name_and_confirm(category: Category, gradebook: Gradebook) -> None:
     print(f"\n{gradebook_response.detail}")
 
 
-def edit_active_status_and_confirm(category: Category, gradebook: Gradebook) -> None:
+def edit_active_status_and_confirm(
+    category: Category, gradebook: Gradebook, _: Collection[str] = ()
+) -> None:
     """
     Toggles the `is_active` field of a `Category` record via calls to `confirm_and_archive()` or `confirm_and_reactivate()`.
 
     Args:
         category (Category): The `Category` object targeted for editing.
         gradebook (Gradebook): The active `Gradebook`.
+        _ (Collection[str]): Queued category names forwarded by `edit_category()` (unused).
     """
     print(f"\nThis category is currently {category.status}.")
 
@@ -341,13 +380,11 @@ def find_and_remove_category(gradebook: Gradebook) -> None:
     Args:
         gradebook (Gradebook): The active `Gradebook`.
     """
-    category_input = prompt_find_category(gradebook)
+    category = prompt_find_category(gradebook)
 
-    if category_input is MenuSignal.CANCEL:
+    if category is MenuSignal.CANCEL:
         return
 
-    category = cast(Category, category_input)
-
     remove_category(category, gradebook)
 
 
@@ -366,42 +403,40 @@ def remove_category(category: Category, gradebook: Gradebook) -> None:
         - All remove and edit operations are dispatched through `Gradebook` to ensure proper mutation and state tracking.
         - Changes are not saved automatically. If the gradebook is marked dirty, the user will be prompted to save before returning to the previous menu.
     """
-    print("\nYou are viewing the following category:")
-    print(model_formatters.format_category_oneline(category))
+    print(
+        "\n".join(
+            (
+                "\nYou are viewing the following category:",
+                model_formatters.format_category_oneline(category),
+            )
+        )
+    )
 
-    title = "What would you like to do?"
-    options = [
-        (
-            "Remove this category (permanently delete the category and all linked assignments and submissions)",
-            confirm_and_remove,
-        ),
-        (
-            "Archive this category (preserve all linked assignments and submissions)",
-            confirm_and_archive,
-        ),
-        (
-            "Edit this category instead",
-            edit_category,
-        ),
-    ]
-    zero_option = "Return to Manage Categories menu"
-
-    menu_response = helpers.display_menu(title, options, zero_option)
-
-    if menu_response is MenuSignal.EXIT:
+    if not helpers.dispatch_menu_selection(
+        _REMOVE_TITLE, _REMOVE_OPTIONS, _REMOVE_ZERO_OPTION, category, gradebook
+    ):
         helpers.returning_without_changes()
         return
-    elif callable(menu_response):
-        menu_response(category, gradebook)
-    else:
-        raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
     if gradebook.has_unsaved_changes:
         helpers.prompt_if_dirty(gradebook)
+        helpers.returning_to("Manage Categories menu")
     else:
-        helpers.returning_without_changes()
+        helpers.returning_to("Manage Categories menu", without_changes=True)
 
-    helpers.returning_to("Manage Categories menu")
+
+def edit_viewed_category(category: Category, gradebook: Gradebook) -> None:
+    """
+    Opens `edit_category()` from the remove menu without repeating the category summary.
+
+    Args:
+        category (Category): The `Category` object being edited.
+        gradebook (Gradebook): The active `Gradebook`.
+
+    Notes:
+        - `remove_category()` has just displayed the category, so the opening summary is skipped.
+    """
+    edit_category(category, gradebook, show_summary=False)
 
 
 def confirm_and_remove(category: Category, gradebook: Gradebook) -> None:
@@ -413,9 +448,15 @@ def confirm_and_remove(category: Category, gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
     """
     helpers.caution_banner()
-    print("You are about to permanently delete the following category:")
-    print(model_formatters.format_category_multiline(category, gradebook))
-    print("\nThis will also delete all linked assignments and submissions.")
+    print(
+        "\n".join(
+            (
+                "You are about to permanently delete the following category:",
+                model_formatters.format_category_multiline(category, gradebook),
+                "\nThis will also delete all linked assignments and submissions.",
+            )
+        )
+    )
 
     confirm_deletion = helpers.confirm_action(
         "Are you sure you want to permanently delete this category? This action cannot be undone."
@@ -453,12 +494,16 @@ def confirm_and_archive(category: Category, gradebook: Gradebook) -> None:
         return
 
     print(
-        "\nArchiving a category is a safe way to deactivate a category without losing data."
+        "\n".join(
+            (
+                "\nArchiving a category is a safe way to deactivate a category without losing data.",
+                "\nYou are about to archive the following category:",
+                model_formatters.format_category_multiline(category, gradebook),
+                "\nThis will preserve all linked assignments and submissions,",
+                "but they will no longer appear in reports or grade calculations.",
+            )
+        )
     )
-    print("\nYou are about to archive the following category:")
-    print(model_formatters.format_category_multiline(category, gradebook))
-    print("\nThis will preserve all linked assignments and submissions,")
-    print("but they will no longer appear in reports or grade calculations.")
 
     confirm_archiving = helpers.confirm_action(
         "Are you sure you want to archive this category?"
@@ -494,8 +539,14 @@ def confirm_and_reactivate(category: Category, gradebook: Gradebook) -> None:
         print("\nThis category is already active.")
         return
 
-    print("\nYou are about to reactivate the following category:")
-    print(model_formatters.format_category_multiline(category, gradebook))
+    print(
+        "\n".join(
+            (
+                "\nYou are about to reactivate the following category:",
+                model_formatters.format_category_multiline(category, gradebook),
+            )
+        )
+    )
 
     confirm_reactivate = helpers.confirm_action(
         "Are you sure you want to reactivate this category?"
@@ -532,23 +583,10 @@ def view_categories_menu(gradebook: Gradebook) -> None:
     Notes:
         - Options include viewing individual, active, inactive, or all categories.
     """
-    title = "View Categories"
-    options = [
-        ("View Individual Category", view_individual_category),
-        ("View Active Categories", view_active_categories),
-        ("View Inactive Categories", view_inactive_categories),
-        ("View All Categories", view_all_categories),
-    ]
-    zero_option = "Return to Manage Categories menu"
-
-    menu_response = helpers.display_menu(title, options, zero_option)
-
-    if menu_response is MenuSignal.EXIT:
+    if not helpers.dispatch_menu_selection(
+        _VIEW_TITLE, _VIEW_OPTIONS, _VIEW_ZERO_OPTION, gradebook
+    ):
         return
-    elif callable(menu_response):
-        menu_response(gradebook)
-    else:
-        raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
     helpers.returning_to("Manage Categories menu")
 
@@ -564,13 +602,11 @@ def view_individual_category(gradebook: Gradebook) -> None:
         - Uses `prompt_find_category()` to search for a record.
         - Prompts the user before displaying the multi-line format.
     """
-    category_input = prompt_find_category(gradebook)
+    category = prompt_find_category(gradebook)
 
-    if category_input is MenuSignal.CANCEL:
+    if category is MenuSignal.CANCEL:
         return
 
-    category = cast(Category, category_input)
-
     print("\nYou are viewing the following category:")
     print(model_formatters.format_category_oneline(category))
 
@@ -588,30 +624,17 @@ def view_active_categories(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` with a filter for active categories.
-        - Records are sorted by name.
+        - Reads the cached `Gradebook.active_categories` partition, already ordered by name, so no filter or sort runs per view.
     """
-    banner = formatters.format_banner_text("Active Categories")
-    print(f"\n{banner}")
-
-    gradebook_response = gradebook.get_records(
-        gradebook.categories, lambda x: x.is_active
-    )
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
-
-    active_categories = gradebook_response.data["records"]
+    active_categories = gradebook.active_categories
 
     if not active_categories:
-        print("There are no active categories.")
+        print(f"\n{_ACTIVE_CATEGORIES_BANNER}\nThere are no active categories.")
         return
 
-    helpers.sort_and_display_records(
-        records=active_categories,
-        sort_key=lambda x: x.name,
-        formatter=model_formatters.format_category_oneline,
+    print(f"\n{_ACTIVE_CATEGORIES_BANNER}")
+    helpers.display_results(
+        active_categories, formatter=model_formatters.format_category_oneline
     )
 
 
@@ -623,30 +646,17 @@ def view_inactive_categories(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` with a filter for inactive students.
-        - Records are sorted by name.
+        - Reads the cached `Gradebook.inactive_categories` partition, already ordered by name, so no filter or sort runs per view.
     """
-    banner = formatters.format_banner_text("Inactive Categories")
-    print(f"\n{banner}")
-
-    gradebook_response = gradebook.get_records(
-        gradebook.categories, lambda x: not x.is_active
-    )
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
-
-    inactive_categories = gradebook_response.data["records"]
+    inactive_categories = gradebook.inactive_categories
 
     if not inactive_categories:
-        print("There are no inactive categories.")
+        print(f"\n{_INACTIVE_CATEGORIES_BANNER}\nThere are no inactive categories.")
         return
 
-    helpers.sort_and_display_records(
-        records=inactive_categories,
-        sort_key=lambda x: x.name,
-        formatter=model_formatters.format_category_oneline,
+    print(f"\n{_INACTIVE_CATEGORIES_BANNER}")
+    helpers.display_results(
+        inactive_categories, formatter=model_formatters.format_category_oneline
     )
 
 
@@ -658,35 +668,26 @@ def view_all_categories(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` to retrieve all categories, active and inactive.
-        - Records are sorted by name.
+        - Reads the cached `Gradebook.categories_sorted` view, active and inactive, already ordered by name.
     """
-    banner = formatters.format_banner_text("All Categories")
-    print(f"\n{banner}")
-
-    gradebook_response = gradebook.get_records(gradebook.categories)
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
-
-    all_categories = gradebook_response.data["records"]
+    all_categories = gradebook.categories_sorted
 
     if not all_categories:
-        print("There are no categories yet.")
+        print(f"\n{_ALL_CATEGORIES_BANNER}\nThere are no categories yet.")
         return
 
-    helpers.sort_and_display_records(
-        records=all_categories,
-        sort_key=lambda x: x.name,
-        formatter=model_formatters.format_category_oneline,
+    print(f"\n{_ALL_CATEGORIES_BANNER}")
+    helpers.display_results(
+        all_categories, formatter=model_formatters.format_category_oneline
     )
 
 
 # === finder methods ===
 
 
-def prompt_find_category(gradebook: Gradebook) -> Category | MenuSignal:
+def prompt_find_category(
+    gradebook: Gradebook,
+) -> Category | Literal[MenuSignal.CANCEL]:
     """
     Prompts the user to locate a `Category` record by search or list selection.
 
@@ -694,7 +695,7 @@ def prompt_find_category(gradebook: Gradebook) -> Category | MenuSignal:
         gradebook (Gradebook): The active `Gradebook`.
 
     Returns:
-        Category | MenuSignal: The selected `Category`, or `MenuSignal.CANCEL` if canceled or no matches are found.
+        Category | Literal[MenuSignal.CANCEL]: The selected `Category`, or `MenuSignal.CANCEL` if canceled or no matches are found.
 
     Raises:
         RuntimeError: If the menu response is unrecognized.
@@ -702,33 +703,91 @@ def prompt_find_category(gradebook: Gradebook) -> Category | MenuSignal:
     Notes:
         - Offers search, active list, and inactive list as selection methods.
         - Returns early if the user chooses to cancel or if no selection is made.
+        - Trying again after a canceled search re-runs the search directly; after a canceled list selection, the selection menu is shown again so a different list can be chosen.
     """
-    title = formatters.format_banner_text("Category Selection")
-    options = [
-        ("Search for a category", helpers.find_category_by_search),
-        ("Select from active categories", helpers.find_active_category_from_list),
-        ("Select from inactive categories", helpers.find_inactive_category_from_list),
-    ]
-    zero_option = "Return and cancel"
-
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
+        menu_response = helpers.display_menu(
+            _FIND_CATEGORY_TITLE, _FIND_CATEGORY_OPTIONS, _FIND_CATEGORY_ZERO_OPTION
+        )
 
         if menu_response is MenuSignal.EXIT:
             return MenuSignal.CANCEL
+        elif not callable(menu_response):
+            raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+
+        # only a search is worth repeating as-is; a list choice goes back to the menu
+        repeat_directly = menu_response is helpers.find_category_by_search
 
-        elif callable(menu_response):
+        while True:
             category = menu_response(gradebook)
 
-            if category is MenuSignal.CANCEL:
-                print("\nCategory selection canceled.")
+            if category is not MenuSignal.CANCEL:
+                return category
 
-                if not helpers.confirm_action("Would you like to try again?"):
-                    return MenuSignal.CANCEL
-                else:
-                    continue
+            print("\nCategory selection canceled.")
 
-            return category
+            if not helpers.confirm_action("Would you like to try again?"):
+                return MenuSignal.CANCEL
 
-        else:
-            raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+            if not repeat_directly:
+                break
+
+
+# === menu option tables ===
+#
+# Static menus are built once at import time. They live at the bottom of the
+# module because each table references handlers defined above.
+
+_RUN_TITLE = formatters.format_banner_text("Manage Categories")
+_RUN_OPTIONS = (
+    ("Add Category", add_category),
+    ("Edit Category", find_and_edit_category),
+    ("Remove Category", find_and_remove_category),
+    ("View Categories", view_categories_menu),
+    ("Manage Category Weights", weights_menu.run),
+)
+_RUN_ZERO_OPTION = "Return to Course Manager menu"
+
+# (field_name, edit_function) pairs used to prompt and edit `Category` attributes
+_EDIT_TITLE = formatters.format_banner_text("Editable Fields")
+_EDITABLE_FIELDS: tuple[
+    tuple[str, Callable[[Category, Gradebook, Collection[str]], None]], ...
+] = (
+    ("Name", edit_name_and_confirm),
+    ("Archived Status", edit_active_status_and_confirm),
+)
+_EDIT_ZERO_OPTION = "Finish editing and return"
+
+_REMOVE_TITLE = "What would you like to do?"
+_REMOVE_OPTIONS = (
+    (
+        "Remove this category (permanently delete the category and all linked assignments and submissions)",
+        confirm_and_remove,
+    ),
+    (
+        "Archive this category (preserve all linked assignments and submissions)",
+        confirm_and_archive,
+    ),
+    (
+        "Edit this category instead",
+        edit_viewed_category,
+    ),
+)
+_REMOVE_ZERO_OPTION = "Return to Manage Categories menu"
+
+_VIEW_TITLE = "View Categories"
+_VIEW_OPTIONS = (
+    ("View Individual Category", view_individual_category),
+    ("View Active Categories", view_active_categories),
+    ("View Inactive Categories", view_inactive_categories),
+    ("View All Categories", view_all_categories),
+)
+_VIEW_ZERO_OPTION = "Return to Manage Categories menu"
+
+_FIND_CATEGORY_TITLE = formatters.format_banner_text("Category Selection")
+_FIND_CATEGORY_OPTIONS = (
+    ("Search for a category", helpers.find_category_by_search),
+    ("Select from active categories", helpers.find_active_category_from_list),
+    ("Select from inactive categories", helpers.find_inactive_category_from_list),
+)
+_FIND_CATEGORY_ZERO_OPTION = "Return and cancel"
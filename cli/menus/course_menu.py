@@ -7,20 +7,15 @@ Provides calls to the top-level menus for managing Students, Categories, Assignm
 as well as the Generate Reports menu and an option to save the gradebook.
 """
 
+import importlib
+from collections.abc import Callable
+
 import cli.menu_helpers as helpers
 import core.formatters as formatters
 from cli.menu_helpers import MenuSignal
-from cli.menus import (
-    assignments_menu,
-    attendance_menu,
-    categories_menu,
-    students_menu,
-    submissions_menu,
-)
 from models.gradebook import Gradebook
 
 
-# TODO: update menu when generate reports is ready
 def run(gradebook: Gradebook) -> None:
     """
     Top-level loop with dispatch for the Course Manager menu.
@@ -35,25 +30,15 @@ def run(gradebook: Gradebook) -> None:
         - The finally block guarantees a check for unsaved changes before returning.
     """
     title = formatters.format_banner_text(f"{gradebook.name} - {gradebook.term}")
-    options = [
-        ("Manage Students", lambda: students_menu.run(gradebook)),
-        ("Manage Attendance", lambda: attendance_menu.run(gradebook)),
-        ("Manage Categories", lambda: categories_menu.run(gradebook)),
-        ("Manage Assignments", lambda: assignments_menu.run(gradebook)),
-        ("Record Submissions", lambda: submissions_menu.run(gradebook)),
-        ("Generate Reports", lambda: print("STUB: Generate Reports")),
-        ("Save Gradebook", lambda: gradebook.save()),
-    ]
-    zero_option = "Return to Start Menu"
 
     try:
         while True:
-            menu_response = helpers.display_menu(title, options, zero_option)
+            menu_response = helpers.display_menu(title, _RUN_OPTIONS, _RUN_ZERO_OPTION)
 
             if menu_response is MenuSignal.EXIT:
                 break
             elif callable(menu_response):
-                menu_response()
+                menu_response(gradebook)
             else:
                 raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
@@ -61,3 +46,61 @@ def run(gradebook: Gradebook) -> None:
         helpers.prompt_if_dirty(gradebook)
 
     helpers.returning_to("Start Menu")
+
+
+# TODO: update menu when generate reports is ready
+def generate_reports(gradebook: Gradebook) -> None:
+    """
+    Placeholder for the Generate Reports menu.
+
+    Args:
+        gradebook (Gradebook): The active `Gradebook`.
+    """
+    print("STUB: Generate Reports")
+
+
+def lazy_submenu(module_name: str) -> Callable[[Gradebook], None]:
+    """
+    Builds a handler that imports a submenu module on first use and runs it.
+
+    Args:
+        module_name (str): The submenu module under `cli.menus` (e.g., "students_menu").
+
+    Returns:
+        A handler that calls the submenu's `run(gradebook)`.
+
+    Notes:
+        - Submenus are only imported once the user opens them, which keeps them off the startup path. Later calls hit `sys.modules`.
+    """
+
+    def run_submenu(gradebook: Gradebook) -> None:
+        importlib.import_module(f"cli.menus.{module_name}").run(gradebook)
+
+    return run_submenu
+
+
+def save_gradebook(gradebook: Gradebook) -> None:
+    """
+    Saves the gradebook to its save directory.
+
+    Args:
+        gradebook (Gradebook): The active `Gradebook`.
+    """
+    gradebook.save()
+
+
+# === menu option tables ===
+#
+# Static menus are built once at import time. Every handler takes the gradebook,
+# so no per-call closures are needed; submenus are imported on first use.
+
+_RUN_OPTIONS = (
+    ("Manage Students", lazy_submenu("students_menu")),
+    ("Manage Attendance", lazy_submenu("attendance_menu")),
+    ("Manage Categories", lazy_submenu("categories_menu")),
+    ("Manage Assignments", lazy_submenu("assignments_menu")),
+    ("Record Submissions", lazy_submenu("submissions_menu")),
+    ("Generate Reports", generate_reports),
+    ("Save Gradebook", save_gradebook),
+)
+_RUN_ZERO_OPTION = "Return to Start Menu"
@@ -14,16 +14,29 @@ Control flow adheres to structured CLI menu patterns with clear terminal-level f
 """
 
 from collections.abc import Callable
-from typing import cast
+from typing import Literal
 
 import cli.menu_helpers as helpers
 import cli.model_formatters as model_formatters
 import core.formatters as formatters
 from cli.menu_helpers import MenuSignal
+from core.response import Response
 from core.utils import generate_uuid
 from models.gradebook import Gradebook
 from models.student import Student
 
+# the view banners never change, so render them once at import
+_ACTIVE_STUDENTS_BANNER = formatters.format_banner_text("Active Students")
+_INACTIVE_STUDENTS_BANNER = formatters.format_banner_text("Inactive Students")
+_ALL_STUDENTS_BANNER = formatters.format_banner_text("All Students")
+
+# name prompts by `first_or_last`, built once rather than on every retry
+_NAME_PROMPTS = {
+    "first": "Enter first name (leave blank to cancel):",
+    "last": "Enter last name (leave blank to cancel):",
+    "": "Enter name (leave blank to cancel):",
+}
+
 
 def run(gradebook: Gradebook) -> None:
     """
@@ -38,25 +51,8 @@ def run(gradebook: Gradebook) -> None:
     Notes:
         - The finally block guarantees a check for unsaved changes before returning.
     """
-    title = formatters.format_banner_text("Manage Students")
-    options = [
-        ("Add Student", add_student),
-        ("Edit Student", find_and_edit_student),
-        ("Remove Student", find_and_remove_student),
-        ("View Students", view_students_menu),
-    ]
-    zero_option = "Return to Course Manager menu"
-
     try:
-        while True:
-            menu_response = helpers.display_menu(title, options, zero_option)
-
-            if menu_response is MenuSignal.EXIT:
-                break
-            elif callable(menu_response):
-                menu_response(gradebook)
-            else:
-                raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+        helpers.run_menu_loop(_RUN_TITLE, _RUN_OPTIONS, _RUN_ZERO_OPTION, gradebook)
 
     finally:
         helpers.prompt_if_dirty(gradebook)
@@ -110,26 +106,12 @@ def prompt_new_student(gradebook: Gradebook) -> Student | None:
     Returns:
         A new `Student` object, or None.
     """
-    email_input = prompt_email_input_or_cancel(gradebook)
-
-    if email_input is MenuSignal.CANCEL:
-        return None
-
-    email = cast(str, email_input)
-
-    first_name_input = prompt_name_input_or_cancel(gradebook, "first")
-
-    if first_name_input is MenuSignal.CANCEL:
-        return None
+    entry = prompt_student_entry_or_cancel(gradebook)
 
-    first_name = cast(str, first_name_input)
-
-    last_name_input = prompt_name_input_or_cancel(gradebook, "last")
-
-    if last_name_input is MenuSignal.CANCEL:
+    if entry is MenuSignal.CANCEL:
         return None
 
-    last_name = cast(str, last_name_input)
+    email, first_name, last_name = entry
 
     try:
         return Student(
@@ -154,14 +136,25 @@ def preview_and_confirm_student(student: Student, gradebook: Gradebook) -> bool:
 
     Returns:
         True if user confirms the `Student` details, and False otherwise.
+
+    Notes:
+        - The preview is rendered once. The edit menu is entered without repeating it, and the preview is shown again only if an edit actually changed it.
     """
-    print("\nYou are about to create the following student:")
-    print(model_formatters.format_student_multiline(student, gradebook))
+    preview = model_formatters.format_student_multiline(student, gradebook)
+
+    print(f"\nYou are about to create the following student:\n{preview}")
 
     if helpers.confirm_action(
         "Would you like to edit this student first (change the name, email address, or enrollment status)?"
     ):
-        edit_student(student, gradebook, "Student creation preview")
+        edit_student(student, gradebook, "Student creation preview", show_summary=False)
+
+        updated_preview = model_formatters.format_student_multiline(student, gradebook)
+
+        if updated_preview != preview:
+            print(
+                f"\nYou are about to create the following student:\n{updated_preview}"
+            )
 
     if helpers.confirm_action("Would you like to create this student?"):
         return True
@@ -173,7 +166,71 @@ def preview_and_confirm_student(student: Student, gradebook: Gradebook) -> bool:
 # === data input helpers ===
 
 
-def prompt_email_input_or_cancel(gradebook: Gradebook) -> str | MenuSignal:
+def prompt_student_entry_or_cancel(
+    gradebook: Gradebook,
+) -> tuple[str, str, str] | Literal[MenuSignal.CANCEL]:
+    """
+    Solicits the email address and name of a new student, accepting all three fields on a single line.
+
+    Args:
+        gradebook (Gradebook): The active `Gradebook`.
+
+    Returns:
+        An `(email, first_name, last_name)` tuple, or `MenuSignal.CANCEL` if the user cancels input.
+
+    Notes:
+        - Accepts either an email address alone or "email, first name, last name" separated by commas.
+        - An invalid or duplicate email, or any name not given on the line, is then prompted for on its own; the other fields are kept.
+    """
+    while True:
+        line_input = helpers.prompt_user_input_or_cancel(
+            "Enter email address, or email, first name, last name separated by commas (leave blank to cancel):"
+        )
+
+        if line_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
+
+        fields = [field.strip() for field in line_input.split(",")]
+
+        if len(fields) in (1, 3):
+            break
+
+        print(
+            f"\n[ERROR] Expected 1 or 3 comma-separated fields but received {len(fields)}."
+        )
+        print("Please try again.")
+
+    email_field, first_name_field, last_name_field = (fields + ["", ""])[:3]
+
+    try:
+        email = Student.validate_email_input(email_field)
+        gradebook.require_unique_student_email(email)
+
+    except ValueError as e:
+        print(f"\n[ERROR] {e}")
+        email_input = prompt_email_input_or_cancel(gradebook)
+
+        if email_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
+
+        email = email_input
+
+    first_name = first_name_field or prompt_name_input_or_cancel(gradebook, "first")
+
+    if first_name is MenuSignal.CANCEL:
+        return MenuSignal.CANCEL
+
+    last_name = last_name_field or prompt_name_input_or_cancel(gradebook, "last")
+
+    if last_name is MenuSignal.CANCEL:
+        return MenuSignal.CANCEL
+
+    return email, first_name, last_name
+
+
+def prompt_email_input_or_cancel(
+    gradebook: Gradebook,
+) -> str | Literal[MenuSignal.CANCEL]:
     """
     Solicits user input for student email, validates formatting and uniqueness, and treats blank input as 'cancel'.
 
@@ -192,8 +249,8 @@ def prompt_email_input_or_cancel(gradebook: Gradebook) -> str | MenuSignal:
             "Enter email address (leave blank to cancel):"
         )
 
-        if isinstance(email_input, MenuSignal):
-            return email_input
+        if email_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
 
         try:
             email = Student.validate_email_input(email_input)
@@ -207,25 +264,25 @@ def prompt_email_input_or_cancel(gradebook: Gradebook) -> str | MenuSignal:
 
 def prompt_name_input_or_cancel(
     _: Gradebook, first_or_last: str = ""
-) -> str | MenuSignal:
+) -> str | Literal[MenuSignal.CANCEL]:
     """
     Solicits user input for student name (first or last), treating blank input as 'cancel'.
 
     Args:
         _ (Gradebook): The active `Gradebook` (unused).
-        first_or_last (str): Optional string to prefix the prompt with 'first name' or 'last name'.
+        first_or_last (str): "first", "last", or "" to select the 'first name', 'last name', or plain 'name' prompt.
 
     Returns:
         User input unmodified, or `MenuSignal.CANCEL` if input is "".
     """
+    prompt = _NAME_PROMPTS[first_or_last]
+
     # uses this structure in case validators are added later
     while True:
-        name_input = helpers.prompt_user_input_or_cancel(
-            f"Enter {(first_or_last + ' name').strip()} (leave blank to cancel):"
-        )
+        name_input = helpers.prompt_user_input_or_cancel(prompt)
 
-        if isinstance(name_input, MenuSignal):
-            return name_input
+        if name_input is MenuSignal.CANCEL:
+            return MenuSignal.CANCEL
 
         try:
             return name_input
@@ -238,21 +295,6 @@ def prompt_name_input_or_cancel(
 # === edit student ===
 
 
-def get_editable_fields() -> list[tuple[str, Callable[[Student, Gradebook], None]]]:
-    """
-    Helper method to organize the list of editable fields and their related functions.
-
-    Returns:
-        A list of `(field_name, edit_function)` tuples used to prompt and edit `Student` attributes.
-    """
-    return [
-        ("First Name", edit_first_name_and_confirm),
-        ("Last Name", edit_last_name_and_confirm),
-        ("Email Address", edit_email_and_confirm),
-        ("Enrollment Status", edit_active_status_and_confirm),
-    ]
-
-
 def find_and_edit_student(gradebook: Gradebook) -> None:
     """
     Prompts user to search for a `Student` and then passes the result to `edit_student()`.
@@ -260,18 +302,19 @@ def find_and_edit_student(gradebook: Gradebook) -> None:
     Args:
         gradebook (Gradebook): The active `Gradebook`.
     """
-    student_input = prompt_find_student(gradebook)
+    student = prompt_find_student(gradebook)
 
-    if student_input is MenuSignal.CANCEL:
+    if student is MenuSignal.CANCEL:
         return
 
-    student = cast(Student, student_input)
-
     edit_student(student, gradebook)
 
 
 def edit_student(
-    student: Student, gradebook: Gradebook, return_context: str = "Manage Students menu"
+    student: Student,
+    gradebook: Gradebook,
+    return_context: str = "Manage Students menu",
+    show_summary: bool = True,
 ) -> None:
     """
     Interface for editing fields of a `Student` record.
@@ -280,6 +323,7 @@ def edit_student(
         student (Student): The `Student` object being edited.
         gradebook (Gradebook): The active `Gradebook`.
         return_context (str): An optional description of the call site, uses "Manage Students menu" by default.
+        show_summary (bool): If False, skips the opening multi-line summary because the caller has just displayed it. Defaults to True.
 
     Raises:
         RuntimeError: If the menu response is unrecognized.
@@ -289,22 +333,15 @@ def edit_student(
         - Changes are not saved automatically. If the gradebook is marked dirty after edits, the user will be prompted to save before returning to the previous menu.
         - The `return_context` label is used to display a confirmation message when exiting the edit menu.
     """
-    print("\nYou are editing the following student:")
-    print(model_formatters.format_student_multiline(student, gradebook))
-
-    title = formatters.format_banner_text("Editable Fields")
-    options = get_editable_fields()
-    zero_option = "Finish editing and return"
+    if show_summary:
+        print("\nYou are editing the following student:")
+        print(model_formatters.format_student_multiline(student, gradebook))
 
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
-
-        if menu_response is MenuSignal.EXIT:
+        if not helpers.dispatch_menu_selection(
+            _EDIT_TITLE, _EDITABLE_FIELDS, _EDIT_ZERO_OPTION, student, gradebook
+        ):
             break
-        elif callable(menu_response):
-            menu_response(student, gradebook)
-        else:
-            raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
         if not helpers.confirm_action(
             "Would you like to continue editing this student?"
@@ -313,10 +350,9 @@ def edit_student(
 
     if gradebook.has_unsaved_changes:
         helpers.prompt_if_dirty(gradebook)
+        helpers.returning_to(return_context)
     else:
-        helpers.returning_without_changes()
-
-    helpers.returning_to(return_context)
+        helpers.returning_to(return_context, without_changes=True)
 
 
 def edit_first_name_and_confirm(student: Student, gradebook: Gradebook) -> None:
@@ -331,33 +367,15 @@ def edit_first_name_and_confirm(student: Student, gradebook: Gradebook) -> None:
         - Cancels early if the user enters nothing or declines the confirmation.
         - Uses `Gradebook.update_student_first_name()` to perform the update and track changes.
     """
-    current_first_name = student.first_name
-    name_input = prompt_name_input_or_cancel(gradebook, "first")
-
-    if name_input is MenuSignal.CANCEL:
-        helpers.returning_without_changes()
-        return
-
-    new_first_name = cast(str, name_input)
-
-    print(
-        f"\nCurrent first name: {current_first_name} -> New first name: {new_first_name}"
+    confirm_and_update_field(
+        student,
+        "first name",
+        student.first_name,
+        prompt_name_input_or_cancel(gradebook, "first"),
+        gradebook.update_student_first_name,
+        "Student name was not updated.",
     )
 
-    if not helpers.confirm_make_change():
-        helpers.returning_without_changes()
-        return
-
-    gradebook_response = gradebook.update_student_first_name(student, new_first_name)
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        print("\nStudent name was not updated.")
-        helpers.returning_without_changes()
-        return
-
-    print(f"\n{gradebook_response.detail}")
-
 
 def edit_last_name_and_confirm(student: Student, gradebook: Gradebook) -> None:
     """
@@ -371,30 +389,14 @@ def edit_last_name_and_confirm(student: Student, gradebook: Gradebook) -> None:
         - Cancels early if the user enters nothing or declines the confirmation.
         - Uses `Gradebook.update_student_last_name()` to perform the update and track changes.
     """
-    current_last_name = student.last_name
-    name_input = prompt_name_input_or_cancel(gradebook, "last")
-
-    if name_input is MenuSignal.CANCEL:
-        helpers.returning_without_changes()
-        return
-
-    new_last_name = cast(str, name_input)
-
-    print(f"\nCurrent last name: {current_last_name} -> New last name: {new_last_name}")
-
-    if not helpers.confirm_make_change():
-        helpers.returning_without_changes()
-        return
-
-    gradebook_response = gradebook.update_student_last_name(student, new_last_name)
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        print("\nStudent name was not updated.")
-        helpers.returning_without_changes()
-        return
-
-    print(f"\n{gradebook_response.detail}")
+    confirm_and_update_field(
+        student,
+        "last name",
+        student.last_name,
+        prompt_name_input_or_cancel(gradebook, "last"),
+        gradebook.update_student_last_name,
+        "Student name was not updated.",
+    )
 
 
 def edit_email_and_confirm(student: Student, gradebook: Gradebook) -> None:
@@ -409,26 +411,53 @@ def edit_email_and_confirm(student: Student, gradebook: Gradebook) -> None:
         - Cancels early if the user enters nothing or declines the confirmation.
         - Uses `Gradebook.update_student_email()` to perform the update and track changes.
     """
-    current_email = student.email
-    email_input = prompt_email_input_or_cancel(gradebook)
+    confirm_and_update_field(
+        student,
+        "email address",
+        student.email,
+        prompt_email_input_or_cancel(gradebook),
+        gradebook.update_student_email,
+        "Student email was not updated.",
+    )
 
-    if email_input is MenuSignal.CANCEL:
+
+def confirm_and_update_field(
+    student: Student,
+    field_label: str,
+    current_value: str,
+    new_value: str | Literal[MenuSignal.CANCEL],
+    update_fn: Callable[[Student, str], Response],
+    failure_message: str,
+) -> None:
+    """
+    Shared confirmation and update flow for the text fields of a `Student` record.
+
+    Args:
+        student (Student): The `Student` targeted for editing.
+        field_label (str): The field name shown in the before/after line (e.g., "first name").
+        current_value (str): The field value captured before the user was prompted.
+        new_value (str | Literal[MenuSignal.CANCEL]): The validated input, or `MenuSignal.CANCEL` if the user canceled.
+        update_fn (Callable[[Student, str], Response]): The bound `Gradebook.update_student_*()` method that applies the change.
+        failure_message (str): The message printed if the update fails.
+
+    Notes:
+        - Cancels early if the input was canceled or the user declines the confirmation.
+    """
+    if new_value is MenuSignal.CANCEL:
         helpers.returning_without_changes()
         return
 
-    new_email = cast(str, email_input)
-
-    print(f"\nCurrent email address: {current_email} -> New email address: {new_email}")
+    print(f"\nCurrent {field_label}: {current_value} -> New {field_label}: {new_value}")
 
     if not helpers.confirm_make_change():
         helpers.returning_without_changes()
         return
 
-    gradebook_response = gradebook.update_student_email(student, new_email)
+    gradebook_response = update_fn(student, new_value)
 
     if not gradebook_response.success:
         helpers.display_response_failure(gradebook_response)
-        print("\nStudent email was not updated.")
+        print(f"\n{failure_message}")
         helpers.returning_without_changes()
         return
 
@@ -465,13 +494,11 @@ def find_and_remove_student(gradebook: Gradebook) -> None:
     Args:
         gradebook (Gradebook): The active `Gradebook`.
     """
-    student_input = prompt_find_student(gradebook)
+    student = prompt_find_student(gradebook)
 
-    if student_input is MenuSignal.CANCEL:
+    if student is MenuSignal.CANCEL:
         return
 
-    student = cast(Student, student_input)
-
     remove_student(student, gradebook)
 
 
@@ -493,36 +520,17 @@ def remove_student(student: Student, gradebook: Gradebook) -> None:
     print("\nYou are viewing the following student:")
     print(model_formatters.format_student_oneline(student))
 
-    title = "What would you like to do?"
-    options = [
-        (
-            "Remove this student (permanently delete the student and all linked submissions)",
-            confirm_and_remove,
-        ),
-        (
-            "Archive this student (preserve all linked records)",
-            confirm_and_archive,
-        ),
-        ("Edit this student instead", edit_student),
-    ]
-    zero_option = "Return to Manage Students menu"
-
-    menu_response = helpers.display_menu(title, options, zero_option)
-
-    if menu_response is MenuSignal.EXIT:
+    if not helpers.dispatch_menu_selection(
+        _REMOVE_TITLE, _REMOVE_OPTIONS, _REMOVE_ZERO_OPTION, student, gradebook
+    ):
         helpers.returning_without_changes()
         return
-    elif callable(menu_response):
-        menu_response(student, gradebook)
-    else:
-        raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
     if gradebook.has_unsaved_changes:
         helpers.prompt_if_dirty(gradebook)
+        helpers.returning_to("Manage Students menu")
     else:
-        helpers.returning_without_changes()
-
-    helpers.returning_to("Manage Students menu")
+        helpers.returning_to("Manage Students menu", without_changes=True)
 
 
 def confirm_and_remove(student: Student, gradebook: Gradebook) -> None:
@@ -534,9 +542,15 @@ def confirm_and_remove(student: Student, gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
     """
     helpers.caution_banner()
-    print("You are about to permanently delete the following student record:")
-    print(model_formatters.format_student_multiline(student, gradebook))
-    print("\nThis will also delete all linked submissions.")
+    print(
+        "\n".join(
+            (
+                "You are about to permanently delete the following student record:",
+                model_formatters.format_student_multiline(student, gradebook),
+                "\nThis will also delete all linked submissions.",
+            )
+        )
+    )
 
     confirm_deletion = helpers.confirm_action(
         "Are you sure you want to permanently delete this student? This action cannot be undone."
@@ -574,12 +588,16 @@ def confirm_and_archive(student: Student, gradebook: Gradebook) -> None:
         return
 
     print(
-        "\nArchiving a student is a safe way to deactivate a student without losing data."
+        "\n".join(
+            (
+                "\nArchiving a student is a safe way to deactivate a student without losing data.",
+                "You are about to archive the following student record:",
+                model_formatters.format_student_multiline(student, gradebook),
+                "\nThis will preserve all linked submissions,",
+                "but they will no longer appear in reports or grade calculations.",
+            )
+        )
     )
-    print("You are about to archive the following student record:")
-    print(model_formatters.format_student_multiline(student, gradebook))
-    print("\nThis will preserve all linked submissions,")
-    print("but they will no longer appear in reports or grade calculations.")
 
     confirm_archiving = helpers.confirm_action(
         "Are you sure you want to archive this student?"
@@ -615,8 +633,14 @@ def confirm_and_reactivate(student: Student, gradebook: Gradebook) -> None:
         print("\nThis student is already active.")
         return
 
-    print("\nYou are about to reactivate the following student record:")
-    print(model_formatters.format_student_multiline(student, gradebook))
+    print(
+        "\n".join(
+            (
+                "\nYou are about to reactivate the following student record:",
+                model_formatters.format_student_multiline(student, gradebook),
+            )
+        )
+    )
 
     confirm_reactivate = helpers.confirm_action(
         "Are you sure you want to reactivate this student?"
@@ -653,23 +677,10 @@ def view_students_menu(gradebook: Gradebook) -> None:
     Notes:
         - Options include viewing individual, active, inactive, or all students.
     """
-    title = "View Students"
-    options = [
-        ("View Individual Student", view_individual_student),
-        ("View Active Students", view_active_students),
-        ("View Inactive Students", view_inactive_students),
-        ("View All Students", view_all_students),
-    ]
-    zero_option = "Return to Manage Students menu"
-
-    menu_response = helpers.display_menu(title, options, zero_option)
-
-    if menu_response is MenuSignal.EXIT:
+    if not helpers.dispatch_menu_selection(
+        _VIEW_TITLE, _VIEW_OPTIONS, _VIEW_ZERO_OPTION, gradebook
+    ):
         return
-    elif callable(menu_response):
-        menu_response(gradebook)
-    else:
-        raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
 
     helpers.returning_to("Manage Students menu")
 
@@ -685,13 +696,11 @@ def view_individual_student(gradebook: Gradebook) -> None:
         - Uses `prompt_find_student()` to search for a record.
         - Prompts the user before displaying the multi-line format.
     """
-    student_input = prompt_find_student(gradebook)
+    student = prompt_find_student(gradebook)
 
-    if student_input is MenuSignal.CANCEL:
+    if student is MenuSignal.CANCEL:
         return
 
-    student = cast(Student, student_input)
-
     print("\nYou are viewing the following student record:")
     print(model_formatters.format_student_oneline(student))
 
@@ -709,30 +718,12 @@ def view_active_students(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` with a filter for active students.
-        - Records are sorted by last name, then first name.
+        - Reads the cached `Gradebook.active_students_sorted` partition, already ordered by last name, then first name, so no filter or sort runs per view.
     """
-    banner = formatters.format_banner_text("Active Students")
-    print(f"\n{banner}")
-
-    gradebook_response = gradebook.get_records(
-        gradebook.students, lambda x: x.is_active
-    )
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
-
-    active_students = gradebook_response.data["records"]
-
-    if not active_students:
-        print("There are no active students.")
-        return
+    active_students = gradebook.active_students_sorted
 
-    helpers.sort_and_display_records(
-        records=active_students,
-        sort_key=lambda x: (x.last_name, x.first_name),
-        formatter=model_formatters.format_student_oneline,
+    display_students(
+        active_students, _ACTIVE_STUDENTS_BANNER, "There are no active students."
     )
 
 
@@ -744,30 +735,12 @@ def view_inactive_students(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` with a filter for inactive students.
-        - Records are sorted by last name, then first name.
+        - Reads the cached `Gradebook.inactive_students_sorted` partition, already ordered by last name, then first name, so no filter or sort runs per view.
     """
-    banner = formatters.format_banner_text("Inactive Students")
-    print(f"\n{banner}")
+    inactive_students = gradebook.inactive_students_sorted
 
-    gradebook_response = gradebook.get_records(
-        gradebook.students, lambda x: not x.is_active
-    )
-
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
-
-    inactive_students = gradebook_response.data["records"]
-
-    if not inactive_students:
-        print("There are no inactive students.")
-        return
-
-    helpers.sort_and_display_records(
-        records=inactive_students,
-        sort_key=lambda x: (x.last_name, x.first_name),
-        formatter=model_formatters.format_student_oneline,
+    display_students(
+        inactive_students, _INACTIVE_STUDENTS_BANNER, "There are no inactive students."
     )
 
 
@@ -779,35 +752,41 @@ def view_all_students(gradebook: Gradebook) -> None:
         gradebook (Gradebook): The active `Gradebook`.
 
     Notes:
-        - Uses `Gradebook.get_records()` to retrieve all students, active and inactive.
-        - Records are sorted by last name, then first name.
+        - Reads the cached `Gradebook.students_sorted` view, active and inactive, already ordered by last name, then first name.
     """
-    banner = formatters.format_banner_text("All Students")
-    print(f"\n{banner}")
+    all_students = gradebook.students_sorted
 
-    gradebook_response = gradebook.get_records(gradebook.students)
+    display_students(all_students, _ALL_STUDENTS_BANNER, "There are no students yet.")
 
-    if not gradebook_response.success:
-        helpers.display_response_failure(gradebook_response)
-        return
 
-    all_students = gradebook_response.data["records"]
+def display_students(
+    students: tuple[Student, ...], banner: str, empty_message: str
+) -> None:
+    """
+    Prints a banner followed by one line per `Student`, or the empty message if there are none.
 
-    if not all_students:
-        print("There are no students yet.")
+    Args:
+        students (tuple[Student, ...]): The pre-sorted records to display.
+        banner (str): The prebuilt banner for this view.
+        empty_message (str): The line printed under the banner when `students` is empty.
+
+    Notes:
+        - Shared by the active, inactive, and all-students views, which differ only in these arguments.
+    """
+    if not students:
+        print(f"\n{banner}\n{empty_message}")
         return
 
-    helpers.sort_and_display_records(
-        records=all_students,
-        sort_key=lambda x: (x.last_name, x.first_name),
-        formatter=model_formatters.format_student_oneline,
-    )
+    print(f"\n{banner}")
+    helpers.display_results(students, formatter=model_formatters.format_student_oneline)
 
 
 # === finder methods ===
 
 
-def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
+def prompt_find_student(
+    gradebook: Gradebook,
+) -> Student | Literal[MenuSignal.CANCEL]:
     """
     Prompts the user to locate a `Student` record by search or list selection.
 
@@ -815,7 +794,7 @@ def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
         gradebook (Gradebook): The active `Gradebook`.
 
     Returns:
-        Student | MenuSignal: The selected `Student`, or `MenuSignal.CANCEL` if canceled or no matches are found.
+        Student | Literal[MenuSignal.CANCEL]: The selected `Student`, or `MenuSignal.CANCEL` if canceled or no matches are found.
 
     Raises:
         RuntimeError: If the menu response is unrecognized.
@@ -824,16 +803,10 @@ def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
         - Offers search, active list, and inactive list as selection methods.
         - Returns early if the user chooses to cancel or if no selection is made.
     """
-    title = formatters.format_banner_text("Student Selection")
-    options = [
-        ("Search for a student", helpers.find_student_by_search),
-        ("Select from active students", helpers.find_active_student_from_list),
-        ("Select from inactive students", helpers.find_inactive_student_from_list),
-    ]
-    zero_option = "Return and cancel"
-
     while True:
-        menu_response = helpers.display_menu(title, options, zero_option)
+        menu_response = helpers.display_menu(
+            _FIND_STUDENT_TITLE, _FIND_STUDENT_OPTIONS, _FIND_STUDENT_ZERO_OPTION
+        )
 
         if menu_response is MenuSignal.EXIT:
             return MenuSignal.CANCEL
@@ -853,3 +826,59 @@ def prompt_find_student(gradebook: Gradebook) -> Student | MenuSignal:
 
         else:
             raise RuntimeError(f"Unexpected MenuResponse received: {menu_response}")
+
+
+# === menu option tables ===
+#
+# Static menus are built once at import time. They live at the bottom of the
+# module because each table references handlers defined above.
+
+_RUN_TITLE = formatters.format_banner_text("Manage Students")
+_RUN_OPTIONS = (
+    ("Add Student", add_student),
+    ("Edit Student", find_and_edit_student),
+    ("Remove Student", find_and_remove_student),
+    ("View Students", view_students_menu),
+)
+_RUN_ZERO_OPTION = "Return to Course Manager menu"
+
+# (field_name, edit_function) pairs used to prompt and edit `Student` attributes
+_EDIT_TITLE = formatters.format_banner_text("Editable Fields")
+_EDITABLE_FIELDS: tuple[tuple[str, Callable[[Student, Gradebook], None]], ...] = (
+    ("First Name", edit_first_name_and_confirm),
+    ("Last Name", edit_last_name_and_confirm),
+    ("Email Address", edit_email_and_confirm),
+    ("Enrollment Status", edit_active_status_and_confirm),
+)
+_EDIT_ZERO_OPTION = "Finish editing and return"
+
+_REMOVE_TITLE = "What would you like to do?"
+_REMOVE_OPTIONS = (
+    (
+        "Remove this student (permanently delete the student and all linked submissions)",
+        confirm_and_remove,
+    ),
+    (
+        "Archive this student (preserve all linked records)",
+        confirm_and_archive,
+    ),
+    ("Edit this student instead", edit_student),
+)
+_REMOVE_ZERO_OPTION = "Return to Manage Students menu"
+
+_VIEW_TITLE = "View Students"
+_VIEW_OPTIONS = (
+    ("View Individual Student", view_individual_student),
+    ("View Active Students", view_active_students),
+    ("View Inactive Students", view_inactive_students),
+    ("View All Students", view_all_students),
+)
+_VIEW_ZERO_OPTION = "Return to Manage Students menu"
+
+_FIND_STUDENT_TITLE = formatters.format_banner_text("Student Selection")
+_FIND_STUDENT_OPTIONS = (
+    ("Search for a student", helpers.find_student_by_search),
+    ("Select from active students", helpers.find_active_student_from_list),
+    ("Select from inactive students", helpers.find_inactive_student_from_list),
+)
+_FIND_STUDENT_ZERO_OPTION = "Return and cancel"
@@ -14,6 +14,7 @@ Control flow adheres to traditional CLI menu patterns with clear terminal-level
 """
 
 from collections.abc import Callable
+from operator import attrgetter
 from typing import cast
 
 import cli.menu_helpers as helpers
@@ -216,10 +217,16 @@ def batch_add_submissions_by_assignment(gradebook: Gradebook) -> None:
 
     assignment = cast(Assignment, assignment_input)
 
+    # collect who has already submitted in one pass, so the roster filter is a set lookup
+    submitted_student_ids = {
+        submission.student_id
+        for submission in gradebook.submissions.values()
+        if submission.assignment_id == assignment.id
+    }
+
     gradebook_response = gradebook.get_records(
         gradebook.students,
-        lambda student: student.is_active
-        and not gradebook.submission_already_exists(assignment.id, student.id),
+        lambda student: student.is_active and student.id not in submitted_student_ids,
     )
 
     if not gradebook_response.success:
@@ -413,6 +420,29 @@ def edit_queued_submissions(
         skipped_students (list[Student]): The list of students who were skipped during batch entry.
         gradebook (Gradebook): The active `Gradebook`.
     """
+    # every list redraw sorts and formats each queued submission, so resolve each
+    # linked student once for the whole review rather than once per key and row
+    students_by_id: dict[str, Student | None] = {}
+
+    def find_queued_student(submission: Submission) -> Student | None:
+        """
+        Lookup method for the `Student` linked to a queued submission, cached for this review.
+
+        Args:
+            submission (Submission): The queued `Submission` record.
+
+        Returns:
+            The linked `Student`, or None if the student could not be found.
+        """
+        if submission.student_id not in students_by_id:
+            gradebook_response = gradebook.find_student_by_uuid(submission.student_id)
+            students_by_id[submission.student_id] = (
+                gradebook_response.data["record"]
+                if gradebook_response.success
+                else None
+            )
+
+        return students_by_id[submission.student_id]
 
     def sort_key_student_name(submission: Submission) -> tuple[str, str] | None:
         """
@@ -424,10 +454,7 @@ def edit_queued_submissions(
         Returns:
             A tuple (last name, first name), or None if the student could not be found.
         """
-        gradebook_response = gradebook.find_student_by_uuid(submission.student_id)
-        student = (
-            gradebook_response.data["record"] if gradebook_response.success else None
-        )
+        student = find_queued_student(submission)
         return (student.last_name, student.first_name) if student else None
 
     def format_submission_batch_preview(submission: Submission) -> str:
@@ -443,10 +470,7 @@ def edit_queued_submissions(
         Notes:
             - Displays '[LATE]' and '[EXEMPT]' in reponse to flags, and '[MISSING STUDENT]' if the linked student cannot be located.
         """
-        gradebook_response = gradebook.find_student_by_uuid(submission.student_id)
-        student = (
-            gradebook_response.data["record"] if gradebook_response.success else None
-        )
+        student = find_queued_student(submission)
         student_name = student.full_name if student else "[MISSING STUDENT]"
         late_status = "[LATE] " if submission.is_late else ""
         score_or_exempt = (
@@ -633,7 +657,7 @@ def review_skipped_students(
         student = helpers.prompt_selection_from_list(
             list_data=skipped_students,
             list_description="Skipped Students",
-            sort_key=lambda x: (x.last_name, x.first_name),
+            sort_key=attrgetter("last_name", "first_name"),
             formatter=model_formatters.format_student_oneline,
         )
 
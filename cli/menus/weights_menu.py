@@ -19,6 +19,7 @@ state mutation (handled by the `Gradebook`) and user input/flow control (handled
 """
 
 import math
+from operator import attrgetter
 from typing import cast
 
 import cli.menu_helpers as helpers
@@ -314,7 +315,7 @@ def view_current_weights(gradebook: Gradebook) -> None:
         print("\nThere are no active categories yet.")
         return
 
-    active_categories = sorted(active_categories, key=lambda x: x.name)
+    active_categories = sorted(active_categories, key=attrgetter("name"))
 
     banner = formatters.format_banner_text("Category Weights")
     print(f"\n{banner}")
@@ -1,6 +1,7 @@
 # cli/model_formatters.py
 
 # anything that renders domain objects or performs Gradebook read-only operations
+import functools
 from textwrap import dedent
 
 import core.formatters as formatters
@@ -14,18 +15,36 @@ from models.submission import Submission
 
 
 def format_student_oneline(student: Student) -> str:
-    status = " [ARCHIVED]" if not student.is_active else ""
+    return _render_student_oneline(student.full_name, student.email, student.is_active)
 
-    return f"{student.full_name:<20} | {student.email}{status}"
+
+# roster views re-render every row on each visit, so cache the line on the values it
+# displays; an edit to the name, email, or status produces a new key
+@functools.lru_cache(maxsize=1024)
+def _render_student_oneline(full_name: str, email: str, is_active: bool) -> str:
+    status = " [ARCHIVED]" if not is_active else ""
+
+    return f"{full_name:<20} | {email}{status}"
 
 
 def format_student_multiline(student: Student, gradebook: Gradebook) -> str:
+    return _render_student_multiline(
+        gradebook.name, student.full_name, student.email, student.status
+    )
+
+
+# students are re-previewed across the add, edit, archive, and remove confirmations, so
+# cache the dedented text on the values it displays, as with categories below
+@functools.lru_cache(maxsize=128)
+def _render_student_multiline(
+    gradebook_name: str, full_name: str, email: str, status: str
+) -> str:
     return dedent(
         f"""\
-        Student in {gradebook.name}:
-        ... Name: {student.full_name}
-        ... Email: {student.email}
-        ... Status: {student.status}"""
+        Student in {gradebook_name}:
+        ... Name: {full_name}
+        ... Email: {email}
+        ... Status: {status}"""
     )
 
 
@@ -42,12 +61,23 @@ def format_category_oneline(category: Category) -> str:
 def format_category_multiline(category: Category, gradebook: Gradebook) -> str:
     weight = f"{category.weight:>5.1f} %" if category.weight else "[UNWEIGHTED]"
 
+    return _render_category_multiline(
+        gradebook.name, category.name, weight, category.status
+    )
+
+
+# the same category is previewed several times per add/edit/remove flow, so cache the
+# dedented text on the values it displays; any edit changes the key
+@functools.lru_cache(maxsize=128)
+def _render_category_multiline(
+    gradebook_name: str, category_name: str, weight: str, status: str
+) -> str:
     return dedent(
         f"""\
-        Category in {gradebook.name}:
-        ... Name: {category.name}
+        Category in {gradebook_name}:
+        ... Name: {category_name}
         ... Weight: {weight}
-        ... Status: {category.status}"""
+        ... Status: {status}"""
     )
 
 
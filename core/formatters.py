@@ -4,11 +4,14 @@
 # must never import from models!
 
 import datetime
-from typing import Any
+import functools
+from collections.abc import Iterable
 
 # === generic text formatters ===
 
 
+# menus redraw the same handful of banners on every pass, so build each one once
+@functools.lru_cache(maxsize=64)
 def format_banner_text(title: str, width: int = 40) -> str:
     line = "=" * width
     centered_title = f"{title:^{width}}"
@@ -16,7 +19,9 @@ def format_banner_text(title: str, width: int = 40) -> str:
     return f"{line}\n{centered_title}\n{line}"
 
 
-def format_list_with_and(items: list[Any]) -> str:
+def format_list_with_and(items: Iterable[str]) -> str:
+    items = items if isinstance(items, tuple) else tuple(items)
+
     if not items:
         return ""
 
@@ -26,7 +31,7 @@ def format_list_with_and(items: list[Any]) -> str:
     if len(items) == 2:
         return " and ".join(items)
 
-    return ", ".join(items[:-1]) + ", and" + items[-1]
+    return f"{', '.join(items[:-1])}, and {items[-1]}"
 
 
 # === date formatters ===
@@ -50,15 +55,41 @@ def format_due_date_from_strings(
     )
 
 
+# class date labels are re-rendered on every schedule view, so memoize them
+@functools.lru_cache(maxsize=512)
 def format_class_date_short(class_date: datetime.date) -> str:
     return f"{class_date.strftime('%a, %b %d')}"
 
 
+@functools.lru_cache(maxsize=512)
 def format_class_date_long(class_date: datetime.date) -> str:
     return f"{class_date.strftime('%A, %B %d, %Y')}"
 
 
+@functools.lru_cache(maxsize=64)
 def format_month_and_year(class_date: datetime.date) -> str:
     line = "-" * 20
     month_and_year = class_date.strftime("%B %Y")
     return f"{line}\n{month_and_year}\n{line}"
+
+
+def format_course_calendar(
+    sorted_dates: Iterable[datetime.date], calendar_name: str = "Calendar View"
+) -> str:
+    banner = format_banner_text(calendar_name)
+    lines = [f"\n{banner}"]
+    last_month_and_year = None
+
+    for current_date in sorted_dates:
+        current_month_and_year = (current_date.month, current_date.year)
+
+        if current_month_and_year != last_month_and_year:
+            lines.append(f"\n{format_month_and_year(current_date)}\n")
+            last_month_and_year = current_month_and_year
+
+        lines.append(f"   {format_class_date_short(current_date)}")
+
+    if len(lines) == 1:
+        lines.append("\nNo dates to display.\n")
+
+    return "\n".join(lines)
@@ -56,6 +56,10 @@ class Response:
         trace (str | None): Optional exception traceback when errors occur.
     """
 
+    # one Response is built per gradebook call (and per item in batch operations),
+    # so skip the per-instance __dict__
+    __slots__ = ("_success", "_detail", "_error", "_status_code", "_data", "_trace")
+
     def __init__(
         self,
         success: bool,
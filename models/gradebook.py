@@ -16,7 +16,8 @@ from __future__ import annotations
 import datetime
 import json
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Collection
+from operator import attrgetter
 from typing import Any
 
 import core.formatters as formatters
@@ -38,7 +39,6 @@ class Gradebook:
 
     def __init__(self, save_dir_path: str):
         self._metadata = {}
-        self._unsaved_changes = False
         self._students = {}
         self._categories = {}
         self._assignments = {}
@@ -46,6 +46,35 @@ class Gradebook:
         self._class_dates = set()
         self._dir_path = save_dir_path
 
+        # derived views are rebuilt lazily, keyed on the mutation revision; the
+        # gradebook is clean whenever the revision matches the last saved one
+        self._revision = 0
+        self._saved_revision = 0
+        self._student_index_cache: (
+            tuple[
+                int,
+                tuple[tuple[Student, ...], tuple[Student, ...], tuple[Student, ...]],
+            ]
+            | None
+        ) = None
+        self._class_dates_sorted_cache: tuple[int, tuple[datetime.date, ...]] | None = (
+            None
+        )
+        self._category_index_cache: (
+            tuple[
+                int,
+                tuple[tuple[Category, ...], tuple[Category, ...], tuple[Category, ...]],
+            ]
+            | None
+        ) = None
+
+        # normalized unique keys -> record id, maintained by the record manipulators
+        self._student_email_index: dict[str, str] = {}
+        self._category_name_index: dict[str, str] = {}
+        self._assignment_name_index: dict[str, str] = {}
+        # (assignment id, student id) -> submission id, the unique pair for a submission
+        self._submission_pair_index: dict[tuple[str, str], str] = {}
+
     # === properties ===
 
     # --- core data structures ---
@@ -70,6 +99,148 @@ class Gradebook:
     def class_dates(self) -> set[datetime.date]:
         return self._class_dates.copy()
 
+    # --- derived views ---
+
+    @property
+    def students_sorted(self) -> tuple[Student, ...]:
+        """
+        All students, active and inactive, ordered by last name, then first name.
+
+        Notes:
+            - Shares a cached name-ordered index with `active_students_sorted` and `inactive_students_sorted` (see `_index_students()`).
+        """
+        return self._index_students()[0]
+
+    @property
+    def active_students_sorted(self) -> tuple[Student, ...]:
+        """
+        Active students ordered by last name, then first name.
+
+        Returns:
+            tuple[Student, ...]: An immutable snapshot of the active roster.
+
+        Notes:
+            - The snapshot is cached and only rebuilt on the first read after a mutation (see `_mark_dirty()`), so repeated reads skip the filter and sort.
+        """
+        return self._index_students()[1]
+
+    @property
+    def inactive_students_sorted(self) -> tuple[Student, ...]:
+        """
+        Inactive (archived) students ordered by last name, then first name.
+
+        Notes:
+            - Shares a cached name-ordered index with `students_sorted` and `active_students_sorted` (see `_index_students()`).
+        """
+        return self._index_students()[2]
+
+    def _index_students(
+        self,
+    ) -> tuple[tuple[Student, ...], tuple[Student, ...], tuple[Student, ...]]:
+        """
+        Builds (all, active, inactive) student snapshots, each ordered by last name, then first name.
+
+        Notes:
+            - Students are sorted once and then split in a single pass, so both partitions inherit the order.
+            - The result is cached until the next mutation (see `_mark_dirty()`).
+        """
+        cached = self._student_index_cache
+
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+
+        ordered = tuple(
+            sorted(self._students.values(), key=attrgetter("last_name", "first_name"))
+        )
+        active: list[Student] = []
+        inactive: list[Student] = []
+
+        for student in ordered:
+            (active if student.is_active else inactive).append(student)
+
+        index = (ordered, tuple(active), tuple(inactive))
+        self._student_index_cache = (self._revision, index)
+
+        return index
+
+    @property
+    def class_dates_sorted(self) -> tuple[datetime.date, ...]:
+        """
+        Scheduled class dates in ascending order.
+
+        Returns:
+            tuple[datetime.date, ...]: An immutable snapshot of the course schedule.
+
+        Notes:
+            - Cached and rebuilt only on the first read after a mutation, like `active_students_sorted`.
+        """
+        cached = self._class_dates_sorted_cache
+
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+
+        schedule = tuple(sorted(self._class_dates))
+        self._class_dates_sorted_cache = (self._revision, schedule)
+
+        return schedule
+
+    @property
+    def categories_sorted(self) -> tuple[Category, ...]:
+        """
+        All categories, active and inactive, ordered by name.
+
+        Notes:
+            - Shares a cached name-ordered index with `active_categories` and `inactive_categories` (see `_index_categories()`).
+        """
+        return self._index_categories()[0]
+
+    @property
+    def active_categories(self) -> tuple[Category, ...]:
+        """
+        Active categories, ordered by name.
+
+        Notes:
+            - Shares a cached name-ordered index with `categories_sorted` and `inactive_categories` (see `_index_categories()`).
+        """
+        return self._index_categories()[1]
+
+    @property
+    def inactive_categories(self) -> tuple[Category, ...]:
+        """
+        Inactive (archived) categories, ordered by name.
+
+        Notes:
+            - Shares a cached name-ordered index with `categories_sorted` and `active_categories` (see `_index_categories()`).
+        """
+        return self._index_categories()[2]
+
+    def _index_categories(
+        self,
+    ) -> tuple[tuple[Category, ...], tuple[Category, ...], tuple[Category, ...]]:
+        """
+        Builds (all, active, inactive) category snapshots, each ordered by name.
+
+        Notes:
+            - Categories are sorted once and then split in a single pass, so both partitions inherit the order.
+            - The result is cached until the next mutation, like `_index_students()`.
+        """
+        cached = self._category_index_cache
+
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+
+        ordered = tuple(sorted(self._categories.values(), key=attrgetter("name")))
+        active: list[Category] = []
+        inactive: list[Category] = []
+
+        for category in ordered:
+            (active if category.is_active else inactive).append(category)
+
+        index = (ordered, tuple(active), tuple(inactive))
+        self._category_index_cache = (self._revision, index)
+
+        return index
+
     # --- metadata fields ---
 
     @property
@@ -98,7 +269,11 @@ class Gradebook:
 
     @property
     def has_unsaved_changes(self) -> bool:
-        return self._unsaved_changes
+        return self._revision != self._saved_revision
+
+    @property
+    def has_class_dates(self) -> bool:
+        return bool(self._class_dates)
 
     def weighting_status(self) -> str:
         return "[ENABLED]" if self.uses_weighting else "[DISABLED]"
@@ -247,6 +422,10 @@ class Gradebook:
             load_and_import("assignments.json", gradebook.import_assignments)
             load_and_import("submissions.json", gradebook.import_submissions)
 
+            # importing replays each record through its add method, so the freshly
+            # loaded state is the on-disk state
+            gradebook._saved_revision = gradebook._revision
+
         except json.JSONDecodeError as e:
             return Response.fail(
                 detail=f"Failed to parse JSON data: {e}",
@@ -370,7 +549,7 @@ class Gradebook:
             )
 
         else:
-            self._unsaved_changes = False
+            self._saved_revision = self._revision
 
             return Response.succeed(detail="Gradebook successfully saved to disk.")
 
@@ -429,6 +608,9 @@ class Gradebook:
         except FileNotFoundError:
             self._class_dates = set()
 
+        # class dates were replaced without `_mark_dirty()`, so drop the cached view
+        self._class_dates_sorted_cache = None
+
     def _import_records(
         self,
         data: list[dict[str, Any]],
@@ -715,13 +897,13 @@ class Gradebook:
         )
 
     def submission_already_exists(self, assignment_id: str, student_id: str) -> bool:
-        return any(
-            (s.assignment_id == assignment_id and s.student_id == student_id)
-            for s in self._submissions.values()
-        )
+        return (assignment_id, student_id) in self._submission_pair_index
 
     # --- attendance records ---
 
+    def is_class_date_scheduled(self, class_date: datetime.date) -> bool:
+        return class_date in self._class_dates
+
     def get_attendance_for_date(
         self, class_date: datetime.date, active_only: bool = True
     ) -> Response:
@@ -788,7 +970,7 @@ class Gradebook:
                 status_code=404,
             )
 
-        for student in sorted(students, key=lambda x: (x.last_name, x.first_name)):
+        for student in sorted(students, key=attrgetter("last_name", "first_name")):
             attendance_report[student.id] = student.attendance_on(class_date)
 
         return Response.succeed(
@@ -1129,17 +1311,16 @@ class Gradebook:
             - This method is read-only and does not raise.
             - The "submission" key is only included in the response on success.
             - The caller is responsible for extracting and casting the `Submission` object from `response.data["submission"]`.
+            - Resolved through `_submission_pair_index`, a single dict lookup.
         """
-        for submission in self._submissions.values():
-            if (
-                submission.assignment_id == assignment_id
-                and submission.student_id == student_id
-            ):
-                return Response.succeed(
-                    data={
-                        "record": submission,
-                    },
-                )
+        submission_id = self._submission_pair_index.get((assignment_id, student_id))
+
+        if submission_id is not None:
+            return Response.succeed(
+                data={
+                    "record": self._submissions[submission_id],
+                },
+            )
 
         return Response.fail(
             detail=f"No matching submission could be found: assignment id {assignment_id}, student id {student_id}.",
@@ -1229,13 +1410,14 @@ class Gradebook:
         Notes:
             - This method is read-only and does not raise.
             - The search query is normalized (lowercased, stripped of leading/trailing whitespace) before searching.
+            - Matches against the pre-normalized keys of `_category_name_index`, so no name is lowercased per search.
         """
         query = self._normalize(query)
 
         matching_categories = [
-            category
-            for category in self._categories.values()
-            if query in category.name.lower()
+            self._categories[category_id]
+            for name_key, category_id in self._category_name_index.items()
+            if query in name_key
         ]
 
         if not matching_categories:
@@ -1307,8 +1489,12 @@ class Gradebook:
     def _mark_dirty(self) -> None:
         """
         Marks the gradebook as having unsaved changes.
+
+        Notes:
+            - Advances `_revision`, which invalidates cached derived views such as `active_students_sorted`.
+            - `has_unsaved_changes` compares `_revision` against the revision recorded by the last `save()` or `load()`.
         """
-        self._unsaved_changes = True
+        self._revision += 1
 
     def _mark_dirty_if_tracked(self, record: RecordType) -> None:
         """
@@ -1499,6 +1685,7 @@ class Gradebook:
             )
 
         else:
+            self._student_email_index[self._normalize(student.email)] = student.id
             self._mark_dirty()
 
             return Response.succeed(
@@ -1572,6 +1759,7 @@ class Gradebook:
             )
 
         else:
+            self._student_email_index.pop(self._normalize(student.email), None)
             self._mark_dirty()
 
             return Response.succeed(
@@ -1751,6 +1939,7 @@ class Gradebook:
             )
 
         try:
+            previous_email = student.email
             student.email = email
 
         except ValueError as e:
@@ -1766,6 +1955,11 @@ class Gradebook:
             )
 
         else:
+            if student.id in self._students:
+                self._reindex_key(
+                    self._student_email_index, student.id, previous_email, student.email
+                )
+
             self._mark_dirty_if_tracked(student)
 
             return Response.succeed(
@@ -1880,6 +2074,7 @@ class Gradebook:
             )
 
         else:
+            self._category_name_index[self._normalize(category.name)] = category.id
             self._mark_dirty()
 
             return Response.succeed(
@@ -1887,6 +2082,100 @@ class Gradebook:
                 data=add_response.data,
             )
 
+    def batch_add_categories(self, categories: list[Category]) -> Response:
+        """
+        Adds multiple categories to the gradebook in a single pass.
+
+        All names are validated up front against the category name index and against each other, then every valid category is inserted at once. This method is not transactional; valid categories are added even if others are skipped.
+
+        Args:
+            categories (list[Category]): A list of `Category` objects to add to the gradebook.
+
+        Returns:
+            Response: A structured response with the following contract:
+                - success (bool):
+                    - True if all categories were successfully added.
+                    - False if one or more categories could not be added.
+                - detail (str | None):
+                    - Indication of complete or partial success.
+                    - On fast-failure, a human-readable description of the error.
+                - error (ErrorCode | str | None):
+                    - `ErrorCode.VALIDATION_FAILED` if one or more categories were skipped due to duplicate names or ids.
+                    - `ErrorCode.INTERNAL_ERROR` if an unexpected error interrupts the batch process.
+                - status_code (int | None):
+                    - 200 if all categories were added successfully
+                    - 400 on failure
+                - data (dict | None):
+                    - "success" (list[Category]): Categories that were successfully added.
+                    - "failure" (list[Category]): Categories that were not added due to validation failure.
+
+        Notes:
+            - Duplicates within the batch are caught as well: the first category with a given name is added and later ones are skipped.
+            - `_mark_dirty()` is called once for the whole batch, and only if at least one category is added.
+            - If an unexpected error interrupts the batch, "success" lists exactly the categories inserted before it, and the gradebook is marked dirty if there are any.
+        """
+        success = []
+        failure = []
+
+        try:
+            valid = []
+            batch_names = set()
+
+            for category in categories:
+                normalized = self._normalize(category.name)
+
+                if (
+                    normalized in self._category_name_index
+                    or normalized in batch_names
+                    or category.id in self._categories
+                ):
+                    failure.append(category)
+                else:
+                    batch_names.add(normalized)
+                    valid.append((normalized, category))
+
+            # "success" only ever lists categories that are actually in the gradebook
+            for normalized, category in valid:
+                self._categories[category.id] = category
+                self._category_name_index[normalized] = category.id
+                success.append(category)
+
+        except Exception as e:
+            if success:
+                self._mark_dirty()
+
+            return Response.fail(
+                detail=f"Unexpected error: {e}",
+                error=ErrorCode.INTERNAL_ERROR,
+                data={
+                    "success": success,
+                    "failure": failure,
+                },
+            )
+
+        else:
+            if success:
+                self._mark_dirty()
+
+            if len(success) == len(categories):
+                return Response.succeed(
+                    detail="All categories successfully added to the gradebook.",
+                    data={
+                        "success": success,
+                        "failure": failure,
+                    },
+                )
+
+            else:
+                return Response.fail(
+                    detail="Not all categories could be successfully added to the gradebook.",
+                    error=ErrorCode.VALIDATION_FAILED,
+                    data={
+                        "success": success,
+                        "failure": failure,
+                    },
+                )
+
     def remove_category(self, category: Category) -> Response:
         """
         Removes a `Category` object and all linked `Assignment` objects from the gradebook.
@@ -1954,6 +2243,7 @@ class Gradebook:
             )
 
         else:
+            self._category_name_index.pop(self._normalize(category.name), None)
             self._mark_dirty()
 
             return Response.succeed(
@@ -1990,6 +2280,7 @@ class Gradebook:
         Notes:
             - This method mutates `Gradebook` stats and calls `_mark_dirty_if_tracked()` if successful.
             - If the input name matches the current value, the method returns early with a success response indicating no changes were made.
+            - For tracked categories, the name index used by `require_unique_category_name()` is re-keyed to the new name.
         """
         if category.name == name:
             return Response.succeed(
@@ -2000,6 +2291,7 @@ class Gradebook:
             )
 
         try:
+            previous_name = category.name
             category.name = name
 
         except Exception as e:
@@ -2009,6 +2301,11 @@ class Gradebook:
             )
 
         else:
+            if category.id in self._categories:
+                self._reindex_key(
+                    self._category_name_index, category.id, previous_name, category.name
+                )
+
             self._mark_dirty_if_tracked(category)
 
             return Response.succeed(
@@ -2189,6 +2486,9 @@ class Gradebook:
             )
 
         else:
+            self._assignment_name_index[self._normalize(assignment.name)] = (
+                assignment.id
+            )
             self._mark_dirty()
 
             return Response.succeed(
@@ -2262,6 +2562,7 @@ class Gradebook:
             )
 
         else:
+            self._assignment_name_index.pop(self._normalize(assignment.name), None)
             self._mark_dirty()
 
             return Response.succeed(
@@ -2311,6 +2612,7 @@ class Gradebook:
         try:
             self.require_unique_assignment_name(name)
 
+            previous_name = assignment.name
             assignment.name = name
 
         except ValueError as e:
@@ -2326,6 +2628,14 @@ class Gradebook:
             )
 
         else:
+            if assignment.id in self._assignments:
+                self._reindex_key(
+                    self._assignment_name_index,
+                    assignment.id,
+                    previous_name,
+                    assignment.name,
+                )
+
             self._mark_dirty_if_tracked(assignment)
 
             return Response.succeed(
@@ -2653,6 +2963,9 @@ class Gradebook:
             )
 
         else:
+            self._submission_pair_index[
+                (submission.assignment_id, submission.student_id)
+            ] = submission.id
             self._mark_dirty()
 
             return Response.succeed(
@@ -2782,6 +3095,9 @@ class Gradebook:
             )
 
         else:
+            self._submission_pair_index.pop(
+                (submission.assignment_id, submission.student_id), None
+            )
             self._mark_dirty()
 
             return Response.succeed(
@@ -3883,27 +4199,45 @@ class Gradebook:
 
         Raises:
             ValueError: If a student with the same normalized email already exists.
+
+        Notes:
+            - Checked against `_student_email_index`, a single dict lookup.
         """
-        normalized = self._normalize(email)
-        if any(self._normalize(s.email) == normalized for s in self._students.values()):
+        if self._normalize(email) in self._student_email_index:
             raise ValueError(f"A student with the email '{email}' already exists.")
 
-    def require_unique_category_name(self, name: str) -> None:
+    def require_unique_category_name(
+        self,
+        name: str,
+        exempt_id: str | None = None,
+        also_reject: Collection[str] = (),
+    ) -> None:
         """
         Validates that no existing category shares the given name.
 
         Args:
             name (str): The category name to validate for uniqueness.
+            exempt_id (str | None): The id of a category being renamed, whose own name does not count as a conflict. Defaults to None.
+            also_reject (Collection[str]): Names of categories not yet in the gradebook (e.g., queued for a batch add) that also count as conflicts. Defaults to none.
 
         Raises:
-            ValueError: If a category with the same normalized name already exists.
+            ValueError: If a category other than `exempt_id`, or any name in `also_reject`, has the same normalized name.
+
+        Notes:
+            - Checked against `_category_name_index`, so validation is a single dict lookup rather than a scan of every category.
+            - Names in `also_reject` are normalized the same way as the index, so callers pass them as entered.
         """
         normalized = self._normalize(name)
-        if any(
-            self._normalize(c.name) == normalized for c in self._categories.values()
-        ):
+        existing_id = self._category_name_index.get(normalized)
+
+        if existing_id is not None and existing_id != exempt_id:
             raise ValueError(f"A category with the name '{name}' already exists.")
 
+        if any(self._normalize(other) == normalized for other in also_reject):
+            raise ValueError(
+                f"A category with the name '{name}' is already queued to be added."
+            )
+
     def require_unique_assignment_name(self, name: str) -> None:
         """
         Validates that no existing assignment shares the given name.
@@ -3913,11 +4247,11 @@ class Gradebook:
 
         Raises:
             ValueError: If an assignment with the same normalized name already exists.
+
+        Notes:
+            - Checked against `_assignment_name_index`, a single dict lookup.
         """
-        normalized = self._normalize(name)
-        if any(
-            self._normalize(a.name) == normalized for a in self._assignments.values()
-        ):
+        if self._normalize(name) in self._assignment_name_index:
             raise ValueError(f"An assignment with the name '{name}' already exists.")
 
     def require_unique_submission(self, assignment_id: str, student_id: str) -> None:
@@ -3930,11 +4264,11 @@ class Gradebook:
 
         Raises:
             ValueError: If a submission already exists for the given student-assignment pair.
+
+        Notes:
+            - Checked against `_submission_pair_index`, a single dict lookup.
         """
-        if any(
-            (s.assignment_id == assignment_id and s.student_id == student_id)
-            for s in self._submissions.values()
-        ):
+        if (assignment_id, student_id) in self._submission_pair_index:
             raise ValueError(
                 "A submission the same linked student and assignment already exists."
             )
@@ -3958,3 +4292,22 @@ class Gradebook:
 
     def _normalize(self, input: str) -> str:
         return input.strip().lower()
+
+    def _reindex_key(
+        self, index: dict[str, str], record_id: str, previous: str, current: str
+    ) -> None:
+        """
+        Moves a record's entry in a unique-key index after the keyed field changes.
+
+        Args:
+            index (dict[str, str]): The index to update (e.g., `_category_name_index`).
+            record_id (str): The id of the record that changed.
+            previous (str): The field value before the change.
+            current (str): The field value after the change.
+        """
+        previous_key = self._normalize(previous)
+
+        if index.get(previous_key) == record_id:
+            del index[previous_key]
+
+        index[self._normalize(current)] = record_id
@@ -21,8 +21,12 @@ from __future__ import annotations
 
 import datetime
 import re
+import sys
 from enum import Enum
 
+# compiled once at import; every email entry and every imported student is checked
+_EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
 
 class AttendanceStatus(str, Enum):
     PRESENT = "Present"
@@ -34,6 +38,18 @@ class AttendanceStatus(str, Enum):
 
 class Student:
 
+    # rosters are loaded whole and their fields are read on every sort, search, and
+    # view, so store them in slots rather than a per-instance __dict__
+    __slots__ = (
+        "_id",
+        "_first_name",
+        "_last_name",
+        "_full_name",
+        "_email",
+        "_is_active",
+        "_attendance",
+    )
+
     def __init__(
         self,
         id: str,
@@ -43,8 +59,10 @@ class Student:
         active: bool = True,
     ):
         self._id = id
-        self._first_name = first_name
-        self._last_name = last_name
+        # names repeat across a roster and are compared on every sort, so share one copy
+        self._first_name = sys.intern(first_name)
+        self._last_name = sys.intern(last_name)
+        self._full_name = f"{self._first_name} {self._last_name}"
         # email uses a validator
         self.email = email
         self._is_active = active
@@ -62,7 +80,8 @@ class Student:
 
     @first_name.setter
     def first_name(self, first_name: str) -> None:
-        self._first_name = first_name
+        self._first_name = sys.intern(first_name)
+        self._full_name = f"{self._first_name} {self._last_name}"
 
     @property
     def last_name(self) -> str:
@@ -70,11 +89,14 @@ class Student:
 
     @last_name.setter
     def last_name(self, last_name: str) -> None:
-        self._last_name = last_name
+        self._last_name = sys.intern(last_name)
+        self._full_name = f"{self._first_name} {self._last_name}"
 
+    # read on every roster row and confirmation line, so kept in sync by the name
+    # setters rather than joined on each access
     @property
     def full_name(self) -> str:
-        return f"{self._first_name} {self._last_name}"
+        return self._full_name
 
     @property
     def email(self) -> str:
@@ -180,7 +202,7 @@ class Student:
             ValueError: If the email does not conform to the expected format.
         """
         email = email.strip().lower()
-        if not re.fullmatch(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email):
+        if not _EMAIL_PATTERN.fullmatch(email):
             raise ValueError(
                 "Invalid input. Email must be a valid address with one @ and a domain."
             )
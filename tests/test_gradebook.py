@@ -8,6 +8,8 @@ import tempfile
 import pytest
 
 from core.response import ErrorCode
+from models.category import Category
+from models.gradebook import Gradebook
 from models.student import AttendanceStatus
 from models.submission import Submission
 
@@ -47,6 +49,23 @@ def test_mark_dirty_if_tracked(sample_gradebook, sample_student):
     assert gb.has_unsaved_changes
 
 
+def test_save_and_load_clear_unsaved_changes(sample_gradebook, sample_student):
+    gb = sample_gradebook
+    gb.add_student(sample_student)
+    assert gb.has_unsaved_changes
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gb.save(temp_dir)
+        assert not gb.has_unsaved_changes
+
+        loaded = Gradebook.load(temp_dir).data["gradebook"]
+        assert not loaded.has_unsaved_changes
+        assert loaded.find_student_by_uuid(sample_student.id).success
+
+    gb.update_student_first_name(sample_student, "Shawn")
+    assert gb.has_unsaved_changes
+
+
 # --- student methods ---
 
 
@@ -105,10 +124,12 @@ def test_update_student_attributes(sample_gradebook, sample_student):
     response = gb.update_student_first_name(sample_student, "Paul")
     assert response.success
     assert sample_student.first_name == "Paul"
+    assert sample_student.full_name == "Paul Cameron"
 
     response = gb.update_student_last_name(sample_student, "Atreides")
     assert response.success
     assert sample_student.last_name == "Atreides"
+    assert sample_student.full_name == "Paul Atreides"
 
     response = gb.update_student_email(sample_student, "patreides@mmm.edu")
     assert response.success
@@ -249,6 +270,67 @@ def test_add_and_remove_category(sample_gradebook, sample_category):
     assert sample_category not in gb.categories.values()
 
 
+def test_batch_add_categories(sample_gradebook):
+    gb = sample_gradebook
+    quizzes = Category("c001", "Quizzes")
+    essays = Category("c002", "Essays")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gb.save(temp_dir)
+    assert not gb.has_unsaved_changes
+
+    response = gb.batch_add_categories([quizzes, essays])
+    assert response.success
+    assert response.data["success"] == [quizzes, essays]
+    assert response.data["failure"] == []
+    assert gb._category_name_index == {"quizzes": "c001", "essays": "c002"}
+    assert gb.has_unsaved_changes
+
+
+def test_batch_add_categories_existing_name(sample_gradebook):
+    gb = sample_gradebook
+    quizzes = Category("c001", "Quizzes")
+    duplicate = Category("c002", "quizzes")
+    essays = Category("c003", "Essays")
+
+    gb.add_category(quizzes)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gb.save(temp_dir)
+
+    response = gb.batch_add_categories([duplicate])
+    assert not response.success
+    assert response.data["success"] == []
+    assert response.data["failure"] == [duplicate]
+    assert gb._category_name_index == {"quizzes": "c001"}
+    assert not gb.has_unsaved_changes
+
+    response = gb.batch_add_categories([duplicate, essays])
+    assert not response.success
+    assert response.data["success"] == [essays]
+    assert response.data["failure"] == [duplicate]
+    assert gb._category_name_index == {"quizzes": "c001", "essays": "c003"}
+    assert gb.has_unsaved_changes
+
+
+def test_batch_add_categories_duplicate_in_batch(sample_gradebook):
+    gb = sample_gradebook
+    first = Category("c001", "Quizzes")
+    duplicate = Category("c002", "Quizzes", 100.0)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gb.save(temp_dir)
+
+    response = gb.batch_add_categories([first, duplicate])
+    assert not response.success
+    assert response.data["success"] == [first]
+    assert response.data["failure"] == [duplicate]
+    assert gb._category_name_index == {"quizzes": "c001"}
+    assert gb.has_unsaved_changes
+    assert list(gb.categories.values()) == [first]
+    with pytest.raises(ValueError):
+        gb.require_unique_category_name(first.name)
+
+
 def test_update_category_attributes(sample_gradebook, sample_category):
     gb = sample_gradebook
 
@@ -678,10 +760,40 @@ def test_submission_already_exists(
     gb.add_submission(sample_submission)
     assert gb.submission_already_exists(sample_assignment.id, sample_student.id)
 
+    response = gb.find_submission_by_assignment_and_student(
+        sample_assignment.id, sample_student.id
+    )
+    assert response.success
+    assert response.data["record"] is sample_submission
+
+    gb.remove_student(sample_student)
+    assert not gb.submission_already_exists(sample_assignment.id, sample_student.id)
+    assert not gb.find_submission_by_assignment_and_student(
+        sample_assignment.id, sample_student.id
+    ).success
+
 
 # --- attendance records ---
 
 
+def test_class_date_lookups(sample_gradebook, sample_course_schedule):
+    gb = sample_gradebook
+    first, second, third = sample_course_schedule
+
+    assert not gb.has_class_dates
+    assert not gb.is_class_date_scheduled(first)
+    assert gb.class_dates_sorted == ()
+
+    gb.batch_add_class_dates(sample_course_schedule)
+    assert gb.has_class_dates
+    assert gb.is_class_date_scheduled(first)
+    assert gb.class_dates_sorted == (third, first, second)
+
+    gb.remove_class_date(third)
+    assert not gb.is_class_date_scheduled(third)
+    assert gb.class_dates_sorted == (first, second)
+
+
 def test_get_attendance_for_date(sample_gradebook, sample_date, sample_student):
     gb = sample_gradebook
     gb.add_student(sample_student)
@@ -759,6 +871,45 @@ def test_find_student_by_query(sample_gradebook, sample_student):
     assert sample_student in search_results
 
 
+def test_active_students_sorted(sample_gradebook, sample_student_roster):
+    gb = sample_gradebook
+    harry, ron, hermione = sample_student_roster
+
+    for student in sample_student_roster:
+        gb.add_student(student)
+
+    assert gb.active_students_sorted == (hermione, harry, ron)
+
+    # cached snapshot is reused until the next mutation
+    assert gb.active_students_sorted is gb.active_students_sorted
+
+    gb.toggle_student_active_status(ron)
+    assert gb.active_students_sorted == (hermione, harry)
+
+    gb.update_student_last_name(hermione, "Weasley")
+    assert gb.active_students_sorted == (harry, hermione)
+
+
+def test_student_index(sample_gradebook, sample_student_roster):
+    gb = sample_gradebook
+    harry, ron, hermione = sample_student_roster
+
+    for student in sample_student_roster:
+        gb.add_student(student)
+
+    assert gb.students_sorted == (hermione, harry, ron)
+    assert gb.inactive_students_sorted == ()
+
+    gb.toggle_student_active_status(harry)
+    assert gb.students_sorted == (hermione, harry, ron)
+    assert gb.active_students_sorted == (hermione, ron)
+    assert gb.inactive_students_sorted == (harry,)
+
+    gb.remove_student(harry)
+    assert gb.students_sorted == (hermione, ron)
+    assert gb.inactive_students_sorted == ()
+
+
 # --- category records ---
 
 
@@ -785,6 +936,36 @@ def test_find_category_by_query(sample_gradebook, sample_category):
     search_results = response.data["records"]
     assert sample_category in search_results
 
+    gb.update_category_name(sample_category, "Renamed")
+    assert not gb.find_category_by_query(query).success
+    assert gb.find_category_by_query(" rename").data["records"] == [sample_category]
+
+
+def test_category_index(
+    sample_gradebook, sample_unweighted_category, sample_weighted_category
+):
+    gb = sample_gradebook
+    first, second = sample_unweighted_category, sample_weighted_category
+    second.name = "second_category"
+
+    gb.add_category(first)
+    gb.add_category(second)
+    assert gb.categories_sorted == (second, first)
+    assert gb.active_categories == (second, first)
+    assert gb.inactive_categories == ()
+
+    gb.toggle_category_active_status(first)
+    assert gb.active_categories == (second,)
+    assert gb.inactive_categories == (first,)
+
+    gb.update_category_name(second, "z_category")
+    assert gb.categories_sorted == (first, second)
+
+    gb.remove_category(second)
+    assert gb.categories_sorted == (first,)
+    assert gb.active_categories == ()
+    assert gb.inactive_categories == (first,)
+
 
 # --- assignment records ---
 
@@ -844,6 +1025,42 @@ def test_require_unique_category_name(sample_gradebook, sample_category):
     gb.require_unique_category_name(category.name)
 
 
+def test_require_unique_category_name_after_rename(sample_gradebook, sample_category):
+    gb = sample_gradebook
+    category = sample_category
+
+    gb.add_category(category)
+    with pytest.raises(ValueError):
+        gb.require_unique_category_name("  TEST_Category ")
+
+    gb.update_category_name(category, "renamed_category")
+    gb.require_unique_category_name("test_category")
+    with pytest.raises(ValueError):
+        gb.require_unique_category_name("renamed_category")
+
+    gb.remove_category(category)
+    gb.require_unique_category_name("renamed_category")
+
+
+def test_require_unique_category_name_exempt_id(sample_gradebook, sample_category):
+    gb = sample_gradebook
+    category = sample_category
+
+    gb.add_category(category)
+    gb.require_unique_category_name(category.name, exempt_id=category.id)
+    gb.require_unique_category_name("TEST_CATEGORY", exempt_id=category.id)
+    with pytest.raises(ValueError):
+        gb.require_unique_category_name(category.name, exempt_id="c999")
+
+
+def test_require_unique_category_name_also_reject(sample_gradebook):
+    gb = sample_gradebook
+
+    gb.require_unique_category_name("Quizzes", also_reject=["Essays"])
+    with pytest.raises(ValueError):
+        gb.require_unique_category_name(" quizzes ", also_reject=["Essays", "Quizzes"])
+
+
 def test_require_unique_assignment_name(sample_gradebook, sample_assignment):
     gb = sample_gradebook
     assignment = sample_assignment
@@ -857,6 +1074,25 @@ def test_require_unique_assignment_name(sample_gradebook, sample_assignment):
     gb.require_unique_assignment_name(assignment.name)
 
 
+def test_require_unique_after_updates(
+    sample_gradebook, sample_student, sample_assignment
+):
+    gb = sample_gradebook
+    student, assignment = sample_student, sample_assignment
+
+    gb.add_student(student)
+    gb.update_student_email(student, "sean@mmm.edu")
+    gb.require_unique_student_email("scameron@mmm.edu")
+    with pytest.raises(ValueError):
+        gb.require_unique_student_email("SEAN@mmm.edu")
+
+    gb.add_assignment(assignment)
+    gb.update_assignment_name(assignment, "renamed_assignment")
+    gb.require_unique_assignment_name("test_assignment")
+    with pytest.raises(ValueError):
+        gb.require_unique_assignment_name("Renamed_Assignment")
+
+
 def test_require_unique_submission(
     sample_gradebook, sample_assignment, sample_student, sample_submission
 ):